@@ -0,0 +1,37 @@
+"""
+Dependency mapping tables for the Rookery OS dependency scripts.
+The tables live as commented literals in _dep_tables.py and are imported
+on first use, so code paths that never map a dependency never pay for them.
+"""
+
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+
+@cache
+def arch_to_rookery() -> Mapping[str, Optional[str]]:
+    """Mapping from Arch package names to Rookery package names (None = ignore)."""
+    from _dep_tables import ARCH_TO_ROOKERY
+    return MappingProxyType(ARCH_TO_ROOKERY)
+
+
+@cache
+def lib_mappings() -> Mapping[str, Optional[str]]:
+    """Mapping from shared library sonames (suffix stripped) to Rookery packages."""
+    from _dep_tables import LIB_MAPPINGS
+    return MappingProxyType(LIB_MAPPINGS)
+
+
+@cache
+def ignore_packages() -> frozenset[str]:
+    """Packages to ignore (virtual packages, groups, build-only, etc.)."""
+    from _dep_tables import IGNORE_PACKAGES
+    return IGNORE_PACKAGES
+
+
+@cache
+def arch_split_packages() -> Mapping[str, Optional[str]]:
+    """Arch-specific split/config packages mapped to Rookery packages (None = ignore)."""
+    from _dep_tables import ARCH_SPLIT_PACKAGES
+    return MappingProxyType(ARCH_SPLIT_PACKAGES)
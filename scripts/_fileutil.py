@@ -0,0 +1,73 @@
+"""
+File helpers shared by the Rookery OS maintenance scripts.
+"""
+
+import io
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import starmap
+from pathlib import Path
+
+
+# Below this many files, starting worker processes costs more than the
+# per-file work they would take over, so it runs in-process instead
+PROCESS_POOL_MIN_FILES = 64
+
+
+def list_specs(specs_dir: Path) -> dict[str, Path]:
+    """Map each .rook file's stem to its path, from a single directory scan."""
+    return {entry.name.removesuffix(".rook"): Path(entry.path) for entry in os.scandir(specs_dir)
+            if entry.name.endswith(".rook") and entry.is_file()}
+
+
+def capture_output(fn, *args) -> tuple:
+    """
+    Call fn(*args) and return (result, printed output). Work run through
+    map_files uses this so its output can be replayed in file order,
+    whether it ran in a worker process or in this one.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = fn(*args)
+    return result, output.getvalue()
+
+
+def write_atomic(path: Path, data: bytes | str) -> None:
+    """
+    Replace a file atomically, so readers never see partial data and an
+    interrupted run never leaves a truncated file behind.
+    An existing file keeps its permission bits; the temporary file is
+    removed again if writing it fails. Text is written as UTF-8.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def map_files(fn, *iterables, chunksize: int = 16) -> list:
+    """
+    Call fn with one item from each iterable per file and return the
+    results in order. Large batches run in a process pool with one worker
+    per CPU; small ones run in this process.
+    """
+    work = list(zip(*iterables))
+    if len(work) < PROCESS_POOL_MIN_FILES:
+        return list(starmap(fn, work))
+
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(fn, *zip(*work), chunksize=chunksize))
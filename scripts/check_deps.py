@@ -5,18 +5,48 @@ Fetches dependency information from Arch Linux packages and compares
 with dependencies declared in .rook spec files.
 """
 
+import gzip
+import hashlib
+import http.client
 import json
+import os
+import pickle
+import random
 import re
+import socket
 import sys
+import threading
+import time
 import tomllib
-import urllib.request
 import urllib.error
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from dataclasses import dataclass, field
 
+from _dep_maps import arch_split_packages, arch_to_rookery, ignore_packages, lib_mappings
+from _fileutil import list_specs, map_files, write_atomic
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decode JSON straight from bytes; orjson is used when installed
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode JSON straight to bytes, using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@dataclass(slots=True, frozen=True)
 class ArchPackageInfo:
     """Arch Linux package information."""
     name: str
@@ -27,7 +57,7 @@ class ArchPackageInfo:
     provides: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RookPackageInfo:
     """Rookery .rook package information."""
     name: str
@@ -37,1221 +67,626 @@ class RookPackageInfo:
     optional_depends: dict[str, str] = field(default_factory=dict)
 
 
-# Mapping from Arch package names to Rookery package names
-ARCH_TO_ROOKERY = {
-    # Qt6 - all Qt6 modules map to qt6
-    "qt6-base": "qt6",
-    "qt6-declarative": "qt6",
-    "qt6-wayland": "qt6",
-    "qt6-svg": "qt6",
-    "qt6-tools": "qt6",
-    "qt6-multimedia": "qt6",
-    "qt6-networkauth": "qt6",
-    "qt6-websockets": "qt6",
-    "qt6-webengine": "qtwebengine",
-    "qt6-webchannel": "qt6",
-    "qt6-positioning": "qt6",
-    "qt6-sensors": "qt6",
-    "qt6-serialport": "qt6",
-    "qt6-connectivity": "qt6",
-    "qt6-imageformats": "qt6",
-    "qt6-5compat": "qt6",
-    "qt6-shadertools": "qt6",
-    "qt6-quick3d": "qt6",
-    "qt6-speech": "qt6",
-
-    # KF5 (legacy) - ignore or map to kf6
-    "frameworkintegration5": None,
-    "kconfigwidgets5": None,
-    "kiconthemes5": None,
-    "kirigami2": None,
-    "kwindowsystem5": None,
-    "breeze5": None,
-
-    # KF6 frameworks
-    "karchive": "kf6-karchive",
-    "kauth": "kf6-kauth",
-    "kbookmarks": "kf6-kbookmarks",
-    "kcalendarcore": "kf6-kcalendarcore",
-    "kcmutils": "kf6-kcmutils",
-    "kcodecs": "kf6-kcodecs",
-    "kcolorscheme": "kf6-kcolorscheme",
-    "kcompletion": "kf6-kcompletion",
-    "kconfig": "kf6-kconfig",
-    "kconfigwidgets": "kf6-kconfigwidgets",
-    "kcontacts": "kf6-kcontacts",
-    "kcoreaddons": "kf6-kcoreaddons",
-    "kcrash": "kf6-kcrash",
-    "kdav": "kf6-kdav",
-    "kdbusaddons": "kf6-kdbusaddons",
-    "kdeclarative": "kf6-kdeclarative",
-    "kded": "kf6-kded",
-    "kdesu": "kf6-kdesu",
-    "kdnssd": "kf6-kdnssd",
-    "kdoctools": None,  # Doc tools, build-only
-    "kfilemetadata": "kf6-kfilemetadata",
-    "kglobalaccel": "kf6-kglobalaccel",
-    "kguiaddons": "kf6-kguiaddons",
-    "kholidays": "kf6-kholidays",
-    "ki18n": "kf6-ki18n",
-    "kiconthemes": "kf6-kiconthemes",
-    "kidletime": "kf6-kidletime",
-    "kimageformats": "kf6-kimageformats",
-    "kio": "kf6-kio",
-    "kirigami": "kf6-kirigami",
-    "kitemmodels": "kf6-kitemmodels",
-    "kitemviews": "kf6-kitemviews",
-    "kjobwidgets": "kf6-kjobwidgets",
-    "knewstuff": "kf6-knewstuff",
-    "knotifications": "kf6-knotifications",
-    "knotifyconfig": "kf6-knotifyconfig",
-    "kpackage": "kf6-kpackage",
-    "kparts": "kf6-kparts",
-    "kpeople": "kf6-kpeople",
-    "kplotting": "kf6-kplotting",
-    "kpty": "kf6-kpty",
-    "kquickcharts": "kf6-kquickcharts",
-    "krunner": "kf6-krunner",
-    "kservice": "kf6-kservice",
-    "kstatusnotifieritem": "kf6-kstatusnotifieritem",
-    "ksvg": "kf6-ksvg",
-    "ktexteditor": "kf6-ktexteditor",
-    "ktexttemplate": "kf6-ktexttemplate",
-    "ktextwidgets": "kf6-ktextwidgets",
-    "kunitconversion": "kf6-kunitconversion",
-    "kuserfeedback": "kf6-kuserfeedback",
-    "kwallet": "kf6-kwallet",
-    "kwidgetsaddons": "kf6-kwidgetsaddons",
-    "kwindowsystem": "kf6-kwindowsystem",
-    "kxmlgui": "kf6-kxmlgui",
-    "solid": "kf6-solid",
-    "sonnet": "kf6-sonnet",
-    "syndication": "kf6-syndication",
-    "syntax-highlighting": "kf6-syntax-highlighting",
-    "threadweaver": "kf6-threadweaver",
-    "attica": "kf6-attica",
-    "baloo": "kf6-baloo",
-    "bluez-qt": "kf6-bluez-qt",
-    "frameworkintegration": "kf6-frameworkintegration",
-    "modemmanager-qt": "kf6-modemmanager-qt",
-    "networkmanager-qt": "kf6-networkmanager-qt",
-    "prison": "kf6-prison",
-    "purpose": "kf6-purpose",
-    "qqc2-desktop-style": "kf6-qqc2-desktop-style",
-    "kf6-karchive": "kf6-karchive",
-    "kf6-kauth": "kf6-kauth",
-    "kf6-kdoctools": None,  # Doc tools, build-only
-    "kf6-kcmutils": "kf6-kcmutils",
-    "kf6-kconfig": "kf6-kconfig",
-    "kf6-kcoreaddons": "kf6-kcoreaddons",
-    "kf6-kcrash": "kf6-kcrash",
-    "kf6-kdbusaddons": "kf6-kdbusaddons",
-    "kf6-kdeclarative": "kf6-kdeclarative",
-    "kf6-kglobalaccel": "kf6-kglobalaccel",
-    "kf6-kguiaddons": "kf6-kguiaddons",
-    "kf6-ki18n": "kf6-ki18n",
-    "kf6-kiconthemes": "kf6-kiconthemes",
-    "kf6-kidletime": "kf6-kidletime",
-    "kf6-kio": "kf6-kio",
-    "kf6-kirigami": "kf6-kirigami",
-    "kf6-kitemmodels": "kf6-kitemmodels",
-    "kf6-kjobwidgets": "kf6-kjobwidgets",
-    "kf6-knewstuff": "kf6-knewstuff",
-    "kf6-knotifications": "kf6-knotifications",
-    "kf6-kpackage": "kf6-kpackage",
-    "kf6-kparts": "kf6-kparts",
-    "kf6-krunner": "kf6-krunner",
-    "kf6-kservice": "kf6-kservice",
-    "kf6-ksvg": "kf6-ksvg",
-    "kf6-kwidgetsaddons": "kf6-kwidgetsaddons",
-    "kf6-kwindowsystem": "kf6-kwindowsystem",
-    "kf6-kxmlgui": "kf6-kxmlgui",
-    "kf6-solid": "kf6-solid",
-    "kf6-frameworkintegration": "kf6-frameworkintegration",
-    "kf6-kcolorscheme": "kf6-kcolorscheme",
-    "kf6-kquickcharts": "kf6-kquickcharts",
-
-    # Core system libs
-    "glibc": "glibc",
-    "gcc-libs": "gcc",
-    "gcc": "gcc",
-    "glib2": "glib2",
-    "gtk3": "gtk3",
-    "gtk4": "gtk4",
-    "systemd": "systemd",
-    "systemd-libs": "systemd",
-    "util-linux-libs": "util-linux",
-    "linux-api-headers": "linux",
-
-    # X11/Wayland/Graphics
-    "libx11": "libx11",
-    "libxcb": "libxcb",
-    "libxext": "libxext",
-    "libxrender": "libxrender",
-    "libxi": "libxi",
-    "libxtst": "libxtst",
-    "libxkbcommon": "libxkbcommon",
-    "libxkbcommon-x11": "libxkbcommon",
-    "libxkbfile": "libxkbfile",
-    "libxcursor": "libxcursor",
-    "libxfixes": "libxfixes",
-    "libxdamage": "libxdamage",
-    "libxrandr": "libxrandr",
-    "libxinerama": "libxinerama",
-    "libxxf86vm": "libxxf86vm",
-    "libxshmfence": "libxshmfence",
-    "libxcomposite": "libxcomposite",
-    "wayland": "wayland",
-    "wayland-protocols": "wayland-protocols",
-    "mesa": "mesa",
-    "libdrm": "libdrm",
-    "libglvnd": "libglvnd",
-    "vulkan-icd-loader": "vulkan-loader",
-    "vulkan-headers": "vulkan-headers",
-    "libepoxy": "libepoxy",
-    "libva": "libva",
-    "libvdpau": "libvdpau",
-
-    # Compression
-    "zlib": "zlib",
-    "xz": "xz",
-    "bzip2": "bzip2",
-    "zstd": "zstd",
-    "lz4": "lz4",
-    "brotli": "brotli",
-    "lzo": "lzo",
-    "snappy": "snappy",
-
-    # Networking
-    "curl": "curl",
-    "openssl": "openssl",
-    "gnutls": "gnutls",
-    "libssh": "libssh",
-    "libssh2": "libssh2",
-    "nghttp2": "nghttp2",
-    "libnghttp2": "nghttp2",
-    "libnghttp3": "nghttp3",
-    "libidn2": "libidn2",
-    "libpsl": "libpsl",
-    "c-ares": "c-ares",
-    "krb5": "krb5",
-
-    # Image/Graphics libs
-    "libpng": "libpng",
-    "libjpeg-turbo": "libjpeg-turbo",
-    "libtiff": "libtiff",
-    "libwebp": "libwebp",
-    "giflib": "giflib",
-    "openjpeg2": "openjpeg",
-    "libraw": "libraw",
-    "libheif": "libheif",
-    "libavif": "libavif",
-    "libjxl": "libjxl",
-    "librsvg": "librsvg",
-    "gdk-pixbuf2": "gdk-pixbuf2",
-    "graphite": "graphite",
-
-    # Fonts/Text
-    "freetype2": "freetype",
-    "fontconfig": "fontconfig",
-    "harfbuzz": "harfbuzz",
-    "harfbuzz-icu": "harfbuzz",
-    "pango": "pango",
-    "cairo": "cairo",
-    "pixman": "pixman",
-    "fribidi": "fribidi",
-
-    # Audio/Video
-    "pipewire": "pipewire",
-    "pipewire-audio": "pipewire",
-    "pipewire-session-manager": "wireplumber",
-    "libpipewire": "pipewire",
-    "wireplumber": "wireplumber",
-    "pulseaudio": "pulseaudio",
-    "libpulse": "pulseaudio",
-    "alsa-lib": "alsa-lib",
-    "ffmpeg": "ffmpeg",
-    "libavcodec.so": None,
-    "libavformat.so": None,
-    "libavutil.so": None,
-    "libswscale.so": None,
-    "libswresample.so": None,
-    "gstreamer": "gstreamer",
-    "gst-plugins-base": "gst-plugins-base",
-    "gst-plugins-good": "gst-plugins-good",
-    "sndio": "sndio",
-    "jack": "jack2",
-    "jack2": "jack2",
-    "opus": "opus",
-    "libvorbis": "libvorbis",
-    "flac": "flac",
-    "lame": "lame",
-    "libsamplerate": "libsamplerate",
-    "speexdsp": "speexdsp",
-    "libcanberra": "libcanberra",
-
-    # Database
-    "sqlite": "sqlite",
-    "sqlite3": "sqlite",
-    "lmdb": "lmdb",
-    "leveldb": "leveldb",
-
-    # Crypto/Security
-    "libgcrypt": "libgcrypt",
-    "libgpg-error": "libgpg-error",
-    "gnupg": "gnupg",
-    "gpgme": "gpgme",
-    "libsecret": "libsecret",
-    "libcap": "libcap",
-    "libcap-ng": "libcap-ng",
-    "audit": "audit",
-    "pam": "linux-pam",
-    "linux-pam": "linux-pam",
-    "polkit": "polkit",
-    "libxcrypt": "libxcrypt",
-
-    # D-Bus/IPC
-    "dbus": "dbus",
-    "at-spi2-core": "at-spi2-core",
-    "at-spi2-atk": "at-spi2-core",
-
-    # Text/XML
-    "libxml2": "libxml2",
-    "libxslt": "libxslt",
-    "expat": "expat",
-    "icu": "icu",
-    "pcre": "pcre",
-    "pcre2": "pcre2",
-    "oniguruma": "oniguruma",
-    "json-c": "json-c",
-    "json-glib": "json-glib",
-    "jansson": "jansson",
-    "jsoncpp": "jsoncpp",
-    "yaml-cpp": "yaml-cpp",
-    "libyaml": "libyaml",
-
-    # Misc libs
-    "libffi": "libffi",
-    "libevent": "libevent",
-    "libuv": "libuv",
-    "libev": "libev",
-    "boost": "boost",
-    "boost-libs": "boost",
-    "ell": "ell",
-    "libelf": None,  # Debug lib, usually optional
-    "elfutils": None,  # Debug lib, usually optional
-    "libdwarf": "libdwarf",
-    "libunwind": "libunwind",
-    "orc": "orc",
-    "fftw": "fftw",
-    "gsl": "gsl",
-    "openblas": "openblas",
-    "lapack": "lapack",
-    "hdf5": "hdf5",
-    "netcdf": "netcdf",
-
-    # Input
-    "libinput": "libinput",
-    "libevdev": "libevdev",
-    "mtdev": "mtdev",
-    "libwacom": "libwacom",
-    "xf86-input-libinput": "xf86-input-libinput",
-
-    # Bluetooth
-    "bluez": "bluez",
-    "bluez-libs": "bluez",
-
-    # Printing
-    "cups": "cups",
-    "libcups": "cups",
-    "cups-filters": "cups-filters",
-
-    # Scanning
-    "sane": "sane-backends",
-
-    # Spell checking
-    "aspell": "aspell",
-    "hunspell": "hunspell",
-    "enchant": "enchant",
-
-    # Build tools
-    "python": "python",
-    "python3": "python",
-    "perl": "perl",
-    "ruby": "ruby",
-    "cmake": "cmake",
-    "ninja": "ninja",
-    "meson": "meson",
-    "make": "make",
-    "autoconf": "autoconf",
-    "automake": "automake",
-    "libtool": "libtool",
-    "m4": "m4",
-    "bison": "bison",
-    "flex": "flex",
-    "extra-cmake-modules": "extra-cmake-modules",
-    "pkgconf": "pkgconf",
-    "pkg-config": "pkgconf",
-    "gettext": "gettext",
-    "intltool": "intltool",
-    "gobject-introspection": "gobject-introspection",
-    "vala": "vala",
-    "swig": "swig",
-    "doxygen": "doxygen",
-
-    # Terminal
-    "ncurses": "ncurses",
-    "readline": "readline",
-
-    # Shell utilities
-    "coreutils": "coreutils",
-    "findutils": "findutils",
-    "diffutils": "diffutils",
-    "patch": "patch",
-    "gzip": "gzip",
-    "tar": "tar",
-    "gawk": "gawk",
-    "sed": "sed",
-    "grep": "grep",
-    "file": "file",
-    "which": "which",
-    "less": "less",
-
-    # Version control
-    "git": "git",
-    "subversion": "subversion",
-    "mercurial": "mercurial",
-
-    # Network tools
-    "iproute2": "iproute2",
-    "iputils": "iputils",
-    "net-tools": "net-tools",
-    "openssh": "openssh",
-    "wget": "wget",
-    "rsync": "rsync",
-
-    # Hardware info
-    "pciutils": "pciutils",
-    "usbutils": "usbutils",
-    "hwdata": "hwdata",
-    "dmidecode": "dmidecode",
-    "lm_sensors": "lm_sensors",
-    "smartmontools": "smartmontools",
-
-    # Desktop
-    "xdg-desktop-portal": "xdg-desktop-portal",
-    "xdg-utils": "xdg-utils",
-    "desktop-file-utils": "desktop-file-utils",
-    "shared-mime-info": "shared-mime-info",
-    "hicolor-icon-theme": "hicolor-icon-theme",
-    "adwaita-icon-theme": "adwaita-icon-theme",
-    "gsettings-desktop-schemas": "gsettings-desktop-schemas",
-
-    # OpenCV
-    "opencv": "opencv",
-
-    # Sensors
-    "iio-sensor-proxy": "iio-sensor-proxy",
-
-    # Mobile
-    "libimobiledevice": "libimobiledevice",
-    "usbmuxd": "usbmuxd",
-
-    # Plasma/KDE packages
-    "plasma-workspace": "plasma-workspace",
-    "plasma-desktop": "plasma-desktop",
-    "plasma-framework": "libplasma",
-    "libplasma": "libplasma",
-    "kwayland": "kwayland",
-    "kwayland-integration": "kwayland",
-    "layer-shell-qt": "layer-shell-qt",
-    "libkscreen": "libkscreen",
-    "libksysguard": "libksysguard",
-    "kdecoration": "kdecoration",
-    "plasma5support": "plasma5support",
-    "kpipewire": "kpipewire",
-    "kactivitymanagerd": "kactivitymanagerd",
-    "kglobalacceld": "kglobalacceld",
-    "kscreenlocker": "kscreenlocker",
-    "kwin": "kwin",
-    "breeze": "breeze",
-    "breeze-icons": "breeze-icons",
-    "breeze-gtk": "breeze-gtk",
-    "oxygen": "oxygen",
-    "oxygen-icons": "oxygen-icons",
-    "sddm": "sddm",
-    "sddm-kcm": "sddm-kcm",
-    "systemsettings": "systemsettings",
-    "kinfocenter": "kinfocenter",
-    "plasma-nm": "plasma-nm",
-    "plasma-pa": "plasma-pa",
-    "bluedevil": "bluedevil",
-    "powerdevil": "powerdevil",
-    "kscreen": "kscreen",
-    "drkonqi": "drkonqi",
-    "milou": "milou",
-    "xdg-desktop-portal-kde": "xdg-desktop-portal-kde",
-    "polkit-kde-agent": "polkit-kde-agent",
-    "kde-cli-tools": "kde-cli-tools",
-    "kde-gtk-config": "kde-gtk-config",
-    "kmenuedit": "kmenuedit",
-    "ksystemstats": "ksystemstats",
-    "plasma-integration": "plasma-integration",
-    "qqc2-breeze-style": "qqc2-breeze-style",
-    "kwallet-pam": "kwallet-pam",
-    "ksshaskpass": "ksshaskpass",
-    "kwrited": "kwrited",
-    "kgamma": "kgamma",
-    "plasma-workspace-wallpapers": "plasma-workspace-wallpapers",
-    "kdeplasma-addons": "kdeplasma-addons",
-    "spectacle": "spectacle",
-    "print-manager": "print-manager",
-    "plasma-systemmonitor": "plasma-systemmonitor",
-    "plasma-disks": "plasma-disks",
-    "plasma-firewall": "plasma-firewall",
-    "plasma-vault": "plasma-vault",
-    "plasma-thunderbolt": "plasma-thunderbolt",
-    "plasma-welcome": "plasma-welcome",
-    "wacomtablet": "wacomtablet",
-    "discover": "discover",
-    "ocean-sound-theme": "ocean-sound-theme",
-    "oxygen-sounds": "oxygen-sounds",
-    "flatpak-kcm": "flatpak-kcm",
-
-    # Additional libs
-    "lcms2": "lcms2",
-    "libexif": "libexif",
-    "exiv2": "exiv2",
-    "poppler": "poppler",
-    "poppler-qt6": "poppler",
-    "djvulibre": "djvulibre",
-    "libspectre": "libspectre",
-    "ebook-tools": "ebook-tools",
-    "chmlib": "chmlib",
-    "discount": "discount",
-
-    # Accessibility
-    "speech-dispatcher": "speech-dispatcher",
-    "espeak-ng": "espeak-ng",
-    "festival": "festival",
-
-    # Power management
-    "upower": "upower",
-    "acpid": "acpid",
-    "tlp": "tlp",
-
-    # Display management
-    "ddcutil": "ddcutil",
-    "colord": "colord",
-
-    # Misc utilities
-    "accountsservice": "accountsservice",
-    "packagekit": "packagekit",
-    "packagekit-qt6": "packagekit",
-    "appstream": "appstream",
-    "appstream-qt": "appstream",
-    "flatpak": "flatpak",
-    "fwupd": "fwupd",
-    "bolt": "bolt",
-    "udisks2": "udisks2",
-    "media-player-info": "media-player-info",
-
-    # Archive formats
-    "libarchive": "libarchive",
-    "p7zip": "p7zip",
-    "unrar": "unrar",
-    "unzip": "unzip",
-    "zip": "zip",
-
-    # KDE applications deps
-    "libkdegames": "libkdegames",
-    "libkmahjongg": "libkmahjongg",
-    "libkdcraw": "libkdcraw",
-    "libkexiv2": "libkexiv2",
-    "libksane": "libksane",
-    "kimageannotator": "kimageannotator",
-    "kcolorpicker": "kcolorpicker",
-
-    # Phonon
-    "phonon-qt6": "phonon",
-    "phonon-qt6-vlc": "phonon-vlc",
-    "phonon-qt6-gstreamer": "phonon-gstreamer",
-
-    # VLC
-    "vlc": "vlc",
-    "libvlc": "vlc",
-
-    # Extra X11
-    "libxaw": "libxaw",
-    "libxmu": "libxmu",
-    "libxt": "libxt",
-    "libxpm": "libxpm",
-    "libxss": "libxscrnsaver",
-    "libxscrnsaver": "libxscrnsaver",
-    "libxft": "libxft",
-    "libxv": "libxv",
-    "libxvmc": "libxvmc",
-    "libxxf86dga": "libxxf86dga",
-    "xcb-util": "xcb-util",
-    "xcb-util-wm": "xcb-util-wm",
-    "xcb-util-image": "xcb-util-image",
-    "xcb-util-keysyms": "xcb-util-keysyms",
-    "xcb-util-renderutil": "xcb-util-renderutil",
-    "xcb-util-cursor": "xcb-util-cursor",
-
-    # Extra Wayland
-    "wlroots": "wlroots",
-    "xdg-desktop-portal-wlr": "xdg-desktop-portal-wlr",
-
-    # Samba
-    "samba": "samba",
-    "libwbclient": "samba",
-    "smbclient": "samba",
-
-    # Additional network
-    "libnm": "networkmanager",
-    "libmm-glib": "modemmanager",
-
-    # GStreamer plugins
-    "gst-plugins-base-libs": "gst-plugins-base",
-    "gst-plugins-bad": "gst-plugins-bad",
-    "gst-plugins-ugly": "gst-plugins-ugly",
-    "gst-plugin-pipewire": "pipewire",
-    "gst-libav": "gst-libav",
-
-    # More specialized libs
-    "mpg123": "mpg123",
-    "openexr": "openexr",
-    "imath": "imath",
-    "nettle": "nettle",
-    "orc": "orc",
-    "libusb": "libusb",
-    "libnl": "libnl",
-    "libpcap": "libpcap",
-    "libnftnl": "libnftnl",
-    "nftables": "nftables",
-    "iptables": "iptables",
-
-    # More Wayland
-    "wayland-utils": "wayland",
-    "weston": "weston",
-
-    # ALSA
-    "alsa-utils": "alsa-utils",
-    "alsa-plugins": "alsa-plugins",
-    "alsa-oss": "alsa-oss",
-
-    # libglib name variations (without .so)
-    "libglib-2.0": "glib2",
-    "libgio-2.0": "glib2",
-    "libgobject-2.0": "glib2",
-    "libgmodule-2.0": "glib2",
-    "libgthread-2.0": "glib2",
-}
+# Official Arch repositories to search, in order
+ARCH_REPOS = ("extra", "core", "multilib")
+
+# Number of packages looked up concurrently
+FETCH_WORKERS = 32
+
+# Package names per batched AUR info query (keeps request URLs reasonably short)
+AUR_BATCH_SIZE = 100
 
-# Packages to ignore (virtual packages, groups, build-only, etc.)
-IGNORE_PACKAGES = {
-    # Virtual packages and meta-packages
-    "base",
-    "base-devel",
-    "filesystem",
-    "sh",
-    "pacman",
-
-    # Core shell utilities (always present on any Linux system)
-    "bash",
-    "coreutils",
-    "grep",
-    "sed",
-    "gawk",
-    "findutils",
-    "util-linux",
-    "which",
-    "less",
-    "file",
-    "tar",
-    "gzip",
-
-    # Build-only tools (not runtime deps)
-    "git",
-    "subversion",
-    "mercurial",
-    "wget",
-    "rsync",
-
-    # Documentation generators (build-only)
-    "doxygen",
-    "sphinx",
-    "asciidoc",
-    "xmlto",
-    "docbook-xsl",
-    "docbook-xml",
-    "gtk-doc",
-    "help2man",
-    "texinfo",
-
-    # Testing tools (build-only)
-    "check",
-    "cppunit",
-    "gtest",
-    "python-pytest",
-    "python-mock",
-    "python-nose",
-    "valgrind",
-
-    # Desktop integration (typically implicit)
-    "hicolor-icon-theme",
-    "xdg-utils",
-    "desktop-file-utils",
-    "shared-mime-info",
-
-    # X.org utilities and virtual packages
-    "xorg-server",
-    "xorg-xwayland",
-    "xorg-setxkbmap",
-    "xorg-xrdb",
-    "xorg-xinit",
-    "xorg-xprop",
-    "xorg-xset",
-    "xorg-xrandr",
-
-    # Firmware and microcode (hardware specific)
-    "linux-firmware",
-    "amd-ucode",
-    "intel-ucode",
-
-    # Font packages (typically optional/runtime choice)
-    "ttf-dejavu",
-    "ttf-liberation",
-    "ttf-freefont",
-    "noto-fonts",
-    "noto-fonts-emoji",
-    "cantarell-fonts",
-
-    # Python optional/test dependencies
-    "python-pip",
-    "python-setuptools",
-    "python-wheel",
-    "python-build",
-    "python-installer",
-    "python-hatchling",
-    "python-flit-core",
-    "python-poetry-core",
-    "cython",
-
-    # Perl build tools
-    "perl-extutils-makemaker",
-    "perl-test-simple",
-    "perl-test-harness",
-
-    # Ruby build tools
-    "ruby-bundler",
-    "ruby-rake",
-
-    # Locale data (implicitly available)
-    "glibc-locales",
-    "ca-certificates",
-    "tzdata",
-
-    # Network services (optional runtime)
-    "avahi",
-    "networkmanager",
-    "modemmanager",
-    "wpa_supplicant",
-
-    # Systemd components (part of systemd)
-    "systemd-sysvcompat",
-    "systemd-resolvconf",
-    "systemd-ukify",
-
-    # X.org protocol headers (build-only)
-    "xorgproto",
-    "xcb-proto",
-    "xproto",
-    "kbproto",
-    "inputproto",
-    "randrproto",
-    "renderproto",
-    "xextproto",
-    "fixesproto",
-    "damageproto",
-    "compositeproto",
-
-    # GObject introspection (build tool)
-    "gobject-introspection",
-
-    # Optional Python bindings
-    "pyside6",
-    "pyside2",
-    "pyqt6",
-    "pyqt5",
-    "sip",
-
-    # Qt5 legacy packages (ignore, use qt6)
-    "qt5-base",
-    "qt5-declarative",
-    "qt5-wayland",
-    "qt5-svg",
-    "qt5-tools",
-    "qt5-multimedia",
-    "qt5-x11extras",
-    "qt5-xmlpatterns",
-    "qt5-graphicaleffects",
-    "qt5-quickcontrols2",
-
-    # WebRTC (specialized, optional)
-    "webrtc-audio-processing",
-    "webrtc-audio-processing-1",
-
-    # LLVM/Clang (usually just for building)
-    "llvm",
-    "llvm-libs",
-    "clang",
-    "lld",
-
-    # More build tools
-    "meson",
-    "ninja",
-    "cmake",
-    "rust",
-    "cargo",
-    "go",
-
-    # Misc optional/specialized
-    "qrencode",
-    "libdvdread",
-    "libdvdnav",
-    "libdvdcss",
-    "libass",
-    "libcdio",
-    "libcdio-paranoia",
-    "libbluray",
-    "libsndfile",
-    "mpg123",
-    "openjpeg",
-    "openexr",
-    "imath",
-    "libraw",
-    "libheif",
-    "libavif",
-    "libjxl",
-
-    # Jack2 is optional for audio apps
-    "jack2",
-    "jack",
-
-    # These are typically transitive or implicit
-    "orc",
-    "libusb",
-    "libnl",
-    "elfutils",
-
-    # Specific test/example programs
-    "kf6-kdoctools",  # Only needed if docs are built
+# HTTP settings for Arch API requests
+HTTP_TIMEOUT = 10
+HTTP_HEADERS = {
+    "User-Agent": "rookpkg-check-deps",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
 }
+HTTP_RETRIES = 3
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+HTTP_BACKOFF = 0.3  # Seconds before the first retry, doubled for each further retry
+
+# On-disk cache of Arch API responses
+CACHE_ROOT = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rookpkg"
+CACHE_DIR = CACHE_ROOT / "arch"
+CACHE_TTL = 24 * 60 * 60  # Arch package metadata changes at most daily
+NEGATIVE_CACHE_TTL = 60 * 60  # Re-check packages that were not found hourly
+
+# Set from the command line: --refresh revalidates every cached response
+# regardless of age, --no-cache neither reads nor writes the cache
+_cache_refresh = False
+_cache_disabled = False
+
+# Parsed .rook files, keyed by (absolute path, mtime in ns)
+SPEC_CACHE_PATH = CACHE_ROOT / "specs.pickle"
+# Bump whenever .rook parsing or the cached field tuple changes, so results
+# from an older parser are discarded instead of reused
+_SPEC_CACHE_VERSION = 1
+
+# Version constraint operators in dependency strings ("pkg>=1.0", "pkg=1.0", ...)
+_VERSION_CONSTRAINT_RE = re.compile(r'[><=]')
+
+# Tables of a .rook file needed for the dependency check
+_ROOK_TABLES = ("package", "depends", "build_depends", "optional_depends")
+
+# Token patterns for the fast .rook parser (matched at a position in the text).
+# TOML forbids control characters other than tab in strings and comments;
+# multi-line strings may also hold LF and CRLF line breaks
+_CTRL = r'\x00-\x08\x0a-\x1f\x7f'
+_MULTILINE_CTRL = r'\x00-\x08\x0b-\x1f\x7f'
+_COMMENT = rf'#[^{_CTRL}]*'
+_BLANK_RE = re.compile(rf'(?:[ \t]|\r?\n|{_COMMENT})*')
+_LINE_END_RE = re.compile(rf'[ \t]*(?:{_COMMENT})?(?:\r?\n|\Z)')
+_INLINE_SPACE_RE = re.compile(r'[ \t]*')
+_TABLE_HEADER_RE = re.compile(r'(\[\[?)[ \t]*([\w-]+)[ \t]*(\]\]?)', re.ASCII)
+_KEY_RE = re.compile(rf'(?:([\w-]+)|"([^"\\{_CTRL}]*)")[ \t]*=[ \t]*', re.ASCII)
+_PLAIN_STRING_RE = re.compile(rf'"([^"\\{_CTRL}]*)"(?!")|\'([^\'{_CTRL}]*)\'(?!\')')
+_ESCAPE = r'\\(?:[btnfr"\\]|u[\da-fA-F]{4}|U[\da-fA-F]{8})'
+_STRING_RE = re.compile(rf'"(?:[^"\\{_CTRL}]|{_ESCAPE})*"|\'[^\'{_CTRL}]*\'')
+_MULTILINE_STRING_RE = re.compile(
+    rf'"""(?:[^"\\{_MULTILINE_CTRL}]|\r\n|{_ESCAPE}|\\[ \t]*\r?\n|""?(?!"))*"{{3,5}}'
+    rf'|\'\'\'(?:[^\'{_MULTILINE_CTRL}]|\r\n|\'\'?(?!\'))*\'{{3,5}}')
+_SCALAR_RE = re.compile(
+    r'true|false|[+-]?(?:inf|nan)|0x[\da-fA-F](?:_?[\da-fA-F])*|0o[0-7](?:_?[0-7])*|0b[01](?:_?[01])*'
+    r'|\d{4}-\d\d-\d\d(?:[T ]\d\d:\d\d:\d\d(?:\.\d+)?(?:Z|[+-]\d\d:\d\d)?)?|\d\d:\d\d:\d\d(?:\.\d+)?'
+    r'|[+-]?(?:0|[1-9](?:_?\d)*)(?:\.\d(?:_?\d)*)?(?:[eE][+-]?\d(?:_?\d)*)?')
+
+# [package] entries that must be read, so they can't be skipped as opaque values
+_PACKAGE_FIELDS = frozenset({"name", "version"})
+
+# Splits a dependency string into name, optional ".so" suffix and optional
+# version constraint in a single match
+_DEP_RE = re.compile(r'\s*([^><=]*?)(\.so)?\s*([><=].*)?', re.DOTALL)
+
+# Marks a name with no explicit mapping (an explicit None means "ignore")
+_UNMAPPED = object()
+
+# Arch package name patterns that never map to a Rookery dependency
+_IGNORED_PREFIXES = ("python-", "perl-", "lib32-")
+_IGNORED_SUFFIXES = ("-git", "-svn", "-bzr", "-hg", "-docs", "-doc")
+
+# Per-thread keep-alive connections, keyed by host
+_thread_state = threading.local()
+
+# Hosts whose name failed to resolve, with the error arguments; later
+# requests to them fail at once instead of waiting on DNS again
+_unresolved_hosts: dict[str, tuple] = {}
+
+
+def _http_get(url: str, headers: dict[str, str]) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    GET a URL and return (status, headers, body).
+    Each worker thread keeps one keep-alive HTTPS connection per host, so
+    repeated requests to archlinux.org skip the TCP and TLS handshakes.
+    Connection errors and transient server errors are retried with jittered
+    exponential backoff; gzip-encoded bodies are decompressed. A host name
+    that fails to resolve is not retried, and neither is any later request
+    to that host.
+    """
+    parts = urllib.parse.urlsplit(url)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    connections = _thread_state.__dict__.setdefault("connections", {})
+
+    if parts.netloc in _unresolved_hosts:
+        raise socket.gaierror(*_unresolved_hosts[parts.netloc])
+
+    for attempt in range(HTTP_RETRIES + 1):
+        conn = connections.get(parts.netloc)
+        if conn is None:
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=HTTP_TIMEOUT)
+            connections[parts.netloc] = conn
+        try:
+            conn.request("GET", target, headers={**HTTP_HEADERS, **headers})
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            # Also covers the server closing an idle keep-alive connection
+            conn.close()
+            del connections[parts.netloc]
+            if isinstance(e, socket.gaierror):
+                _unresolved_hosts[parts.netloc] = e.args
+                raise
+            if attempt == HTTP_RETRIES:
+                raise
+        else:
+            if response.status not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                if response.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                return response.status, response.headers, body
+
+        time.sleep(HTTP_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5))
+
+
+def _cached_get(url: str, ttl: int = CACHE_TTL):
+    """
+    GET a JSON document, caching the response on disk.
+    Returns the decoded JSON, or None if the server answered 404.
+    Stale entries are revalidated with a conditional GET (ETag/Last-Modified).
+    Other HTTP and network errors are raised to the caller.
+    """
+    if _cache_disabled:
+        status, response_headers, body = _http_get(url, {})
+        if status == 404:
+            return None
+        if status != 200:
+            raise urllib.error.HTTPError(url, status, f"HTTP {status}", response_headers, None)
+        return _json_loads(body)
 
+    body_path = CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+    meta_path = body_path.with_suffix(".meta")
 
-def fetch_arch_package_info(package_name: str) -> Optional[ArchPackageInfo]:
-    """Fetch package info from Arch Linux API."""
-    # Try official repos first
-    for repo in ["extra", "core", "multilib"]:
+    try:
+        meta = _json_loads(meta_path.read_bytes())
+        age = time.time() - meta_path.stat().st_mtime
+    except (OSError, ValueError):
+        meta = {}
+        age = None
+
+    if meta and age is not None and not _cache_refresh:
+        if meta.get("status") == 404:
+            if age < NEGATIVE_CACHE_TTL:
+                return None
+        elif age < ttl:
+            try:
+                return _json_loads(body_path.read_bytes())
+            except (OSError, ValueError):
+                meta = {}
+
+    headers = {}
+    if meta.get("status") == 200:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    status, response_headers, body = _http_get(url, headers)
+    if status == 304:
+        # Not modified: refresh the entry's age and serve the cached body
+        try:
+            data = _json_loads(body_path.read_bytes())
+        except (OSError, ValueError):
+            # The cached body is missing or damaged; fetch it again in full
+            status, response_headers, body = _http_get(url, {})
+        else:
+            write_atomic(meta_path, _json_dumps(meta))
+            return data
+    if status == 404:
+        write_atomic(meta_path, _json_dumps({"status": 404}))
+        return None
+    if status != 200:
+        raise urllib.error.HTTPError(url, status, f"HTTP {status}", response_headers, None)
+
+    data = _json_loads(body)
+    write_atomic(body_path, body)
+    write_atomic(meta_path, _json_dumps({
+        "status": 200,
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }))
+    return data
+
+
+def _official_package_info(data: dict, package_name: str) -> ArchPackageInfo:
+    """Build package info from an archlinux.org package JSON document."""
+    return ArchPackageInfo(
+        name=data.get("pkgname", package_name),
+        version=data.get("pkgver", ""),
+        depends=data.get("depends", []),
+        makedepends=data.get("makedepends", []),
+        optdepends=[opt.split(":")[0].strip() for opt in data.get("optdepends", [])],
+        provides=data.get("provides", []),
+    )
+
+
+def _aur_package_info(pkg: dict, package_name: str) -> ArchPackageInfo:
+    """Build package info from an AUR RPC result entry."""
+    return ArchPackageInfo(
+        name=pkg.get("Name", package_name),
+        version=pkg.get("Version", ""),
+        depends=pkg.get("Depends", []) or [],
+        makedepends=pkg.get("MakeDepends", []) or [],
+        optdepends=[opt.split(":")[0].strip() for opt in (pkg.get("OptDepends", []) or [])],
+        provides=pkg.get("Provides", []) or [],
+    )
+
+
+def fetch_official_package_info(package_name: str) -> Optional[ArchPackageInfo]:
+    """Fetch package info from the official Arch Linux repositories."""
+    for repo in ARCH_REPOS:
         url = f"https://archlinux.org/packages/{repo}/x86_64/{package_name}/json/"
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                return ArchPackageInfo(
-                    name=data.get("pkgname", package_name),
-                    version=data.get("pkgver", ""),
-                    depends=data.get("depends", []),
-                    makedepends=data.get("makedepends", []),
-                    optdepends=[opt.split(":")[0].strip() for opt in data.get("optdepends", [])],
-                    provides=data.get("provides", []),
-                )
+            data = _cached_get(url)
+            if data is not None:
+                return _official_package_info(data, package_name)
         except urllib.error.HTTPError:
             continue
         except Exception as e:
             print(f"  Warning: Error fetching {package_name} from {repo}: {e}", file=sys.stderr)
             continue
 
-    # Try AUR as fallback for KDE packages
-    try:
-        url = f"https://aur.archlinux.org/rpc/?v=5&type=info&arg={package_name}"
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            if data.get("resultcount", 0) > 0:
-                pkg = data["results"][0]
-                return ArchPackageInfo(
-                    name=pkg.get("Name", package_name),
-                    version=pkg.get("Version", ""),
-                    depends=pkg.get("Depends", []) or [],
-                    makedepends=pkg.get("MakeDepends", []) or [],
-                    optdepends=[opt.split(":")[0].strip() for opt in (pkg.get("OptDepends", []) or [])],
-                    provides=pkg.get("Provides", []) or [],
-                )
-    except Exception:
-        pass
+    return None
+
+
+def fetch_aur_package_info(package_names: list[str]) -> dict[str, ArchPackageInfo]:
+    """Fetch package info from the AUR, batching names into multi-info queries."""
+    results = {}
+    for i in range(0, len(package_names), AUR_BATCH_SIZE):
+        batch = package_names[i:i + AUR_BATCH_SIZE]
+        args = "&".join(f"arg[]={urllib.parse.quote(name)}" for name in batch)
+        url = f"https://aur.archlinux.org/rpc/?v=5&type=info&{args}"
+        try:
+            data = _cached_get(url) or {}
+            for pkg in data.get("results", []):
+                name = pkg.get("Name")
+                if name in batch:
+                    results[name] = _aur_package_info(pkg, name)
+        except Exception:
+            pass
+
+    return results
+
+
+def fetch_arch_packages(package_names: list[str],
+                        max_workers: int = FETCH_WORKERS) -> dict[str, Optional[ArchPackageInfo]]:
+    """
+    Fetch package info for many packages concurrently.
+    Official repos are queried in parallel over at most max_workers
+    keep-alive connections; anything not found there falls back to a
+    batched AUR lookup (mostly KDE packages).
+    """
+    names = list(dict.fromkeys(package_names))
+    if not names:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as executor:
+        results = dict(zip(names, executor.map(fetch_official_package_info, names)))
+
+    missing = [name for name, info in results.items() if info is None]
+    if missing:
+        results.update(fetch_aur_package_info(missing))
+
+    return results
+
+
+def fetch_arch_package_info(package_name: str) -> Optional[ArchPackageInfo]:
+    """Fetch package info from Arch Linux API."""
+    return fetch_arch_packages([package_name])[package_name]
+
+
+def _skip_value(text: str, pos: int) -> Optional[int]:
+    """
+    Return the end of the TOML value starting at pos without decoding it,
+    or None if it is not a value the fast parser understands.
+    """
+    match = (_MULTILINE_STRING_RE.match(text, pos) or _STRING_RE.match(text, pos)
+             or _SCALAR_RE.match(text, pos))
+    if match:
+        return match.end()
+
+    if text.startswith("[", pos):
+        # Arrays may span lines and hold comments between elements
+        pos = _BLANK_RE.match(text, pos + 1).end()
+        while not text.startswith("]", pos):
+            pos = _skip_value(text, pos)
+            if pos is None:
+                return None
+            pos = _BLANK_RE.match(text, pos).end()
+            if text.startswith(",", pos):
+                pos = _BLANK_RE.match(text, pos + 1).end()
+            elif not text.startswith("]", pos):
+                return None
+        return pos + 1
+
+    if text.startswith("{", pos):
+        # Inline tables stay on one line, apart from values spanning lines
+        keys = set()
+        pos = _INLINE_SPACE_RE.match(text, pos + 1).end()
+        if text.startswith("}", pos):
+            return pos + 1
+        while True:
+            match = _KEY_RE.match(text, pos)
+            if not match or match.group(match.lastindex) in keys:
+                return None
+            keys.add(match.group(match.lastindex))
+            pos = _skip_value(text, match.end())
+            if pos is None:
+                return None
+            pos = _INLINE_SPACE_RE.match(text, pos).end()
+            if text.startswith("}", pos):
+                return pos + 1
+            if not text.startswith(",", pos):
+                return None
+            pos = _INLINE_SPACE_RE.match(text, pos + 1).end()
 
     return None
 
 
+def _parse_rook_tables(text: str) -> Optional[dict[str, dict]]:
+    """
+    Extract the tables needed for the dependency check from .rook text.
+    Every other value is scanned and skipped without being decoded. The
+    dependency tables and the package name and version must be plain
+    strings; for those, anything outside a simple subset of TOML, and any
+    input tomllib would reject such as duplicate keys or tables, returns
+    None so the caller can fall back to tomllib.
+    """
+    tables = {name: {} for name in _ROOK_TABLES}
+    defined = set()  # [table] names
+    arrays = set()  # [[array of tables]] names
+    root_keys = keys = set()
+    current = None
+    pos = 0
+
+    while True:
+        pos = _BLANK_RE.match(text, pos).end()
+        if pos == len(text):
+            return tables
+
+        if text.startswith("[", pos):
+            match = _TABLE_HEADER_RE.match(text, pos)
+            if not match:
+                return None
+            opening, name, closing = match.groups()
+            if len(opening) != len(closing) or name in defined or name in root_keys:
+                return None
+            if len(opening) == 2:
+                arrays.add(name)
+                current = None
+            elif name in arrays:
+                return None
+            else:
+                defined.add(name)
+                current = tables.get(name)
+            keys = set()
+            pos = match.end()
+        else:
+            match = _KEY_RE.match(text, pos)
+            if not match:
+                return None
+            key = match.group(match.lastindex)
+            # A root-level key may not stand in for a table the parser reads
+            if key in keys or (keys is root_keys and key in _ROOK_TABLES):
+                return None
+            keys.add(key)
+            pos = match.end()
+
+            value = _PLAIN_STRING_RE.match(text, pos)
+            if value:
+                if current is not None:
+                    current[key] = value.group(value.lastindex)
+                pos = value.end()
+            elif current is not None and (current is not tables["package"] or key in _PACKAGE_FIELDS):
+                return None
+            else:
+                pos = _skip_value(text, pos)
+                if pos is None:
+                    return None
+
+        match = _LINE_END_RE.match(text, pos)
+        if not match:
+            return None
+        pos = match.end()
+
+
+def _intern_keys(table: dict[str, str]) -> dict[str, str]:
+    """Intern dependency names; the same few hundred recur across every spec."""
+    return {sys.intern(name): value for name, value in table.items()}
+
+
 def parse_rook_file(path: Path) -> Optional[RookPackageInfo]:
     """Parse a .rook TOML file."""
     try:
-        with open(path, "rb") as f:
-            data = tomllib.load(f)
+        text = path.read_text(encoding="utf-8")
+        data = _parse_rook_tables(text)
+        if data is None:
+            data = tomllib.loads(text)
 
         pkg = data.get("package", {})
         return RookPackageInfo(
             name=pkg.get("name", path.stem),
             version=pkg.get("version", ""),
-            depends=data.get("depends", {}),
-            build_depends=data.get("build_depends", {}),
-            optional_depends=data.get("optional_depends", {}),
+            depends=_intern_keys(data.get("depends", {})),
+            build_depends=_intern_keys(data.get("build_depends", {})),
+            optional_depends=_intern_keys(data.get("optional_depends", {})),
         )
     except Exception as e:
         print(f"Error parsing {path}: {e}", file=sys.stderr)
         return None
 
 
+def load_spec_cache() -> dict[tuple[str, int], tuple]:
+    """
+    Load the parsed-spec cache saved by a previous run.
+    A cache from another parser version, or one that is not in the expected
+    format, is treated as empty.
+    """
+    try:
+        with open(SPEC_CACHE_PATH, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+
+    if (not isinstance(data, dict) or data.get("version") != _SPEC_CACHE_VERSION
+            or not isinstance(data.get("entries"), dict)):
+        return {}
+    return data["entries"]
+
+
+def save_spec_cache(cache: dict[tuple[str, int], tuple]) -> None:
+    """
+    Persist the parsed-spec cache. Only entries whose file still exists with
+    the cached mtime are kept, so deleted and edited specs drop out.
+    """
+    current = {}
+    for (path, mtime), fields in cache.items():
+        try:
+            if os.stat(path).st_mtime_ns == mtime:
+                current[path, mtime] = fields
+        except OSError:
+            pass
+    try:
+        write_atomic(SPEC_CACHE_PATH, pickle.dumps({"version": _SPEC_CACHE_VERSION, "entries": current},
+                                                   protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        print(f"Warning: Could not save spec cache: {e}", file=sys.stderr)
+
+
+def _rook_package_from_fields(fields: tuple) -> RookPackageInfo:
+    """
+    Rebuild package info from cached or worker-parsed fields.
+    Unpickling does not preserve interning, so dependency names are
+    interned again in this process.
+    """
+    name, version, depends, build_depends, optional_depends = fields
+    return RookPackageInfo(name, version, _intern_keys(depends),
+                           _intern_keys(build_depends), _intern_keys(optional_depends))
+
+
+def parse_rook_files(paths: list[Path], cache: dict[tuple[str, int], tuple]) -> list[Optional[RookPackageInfo]]:
+    """
+    Parse .rook files, reusing cached results for unchanged files.
+    The remaining files are parsed in a process pool when there are enough
+    of them to pay for starting one.
+    """
+    results: list[Optional[RookPackageInfo]] = []
+    misses = []  # (index into results, cache key or None)
+
+    for path in paths:
+        try:
+            key = (os.path.abspath(path), path.stat().st_mtime_ns)
+        except OSError:
+            key = None
+
+        fields = cache.get(key)
+        if fields is not None:
+            results.append(_rook_package_from_fields(fields))
+        else:
+            misses.append((len(results), key))
+            results.append(None)
+
+    if misses:
+        parsed = map_files(parse_rook_file, [paths[i] for i, _ in misses])
+        for (i, key), rook_pkg in zip(misses, parsed):
+            if not rook_pkg:
+                continue
+            fields = (rook_pkg.name, rook_pkg.version, rook_pkg.depends,
+                      rook_pkg.build_depends, rook_pkg.optional_depends)
+            results[i] = _rook_package_from_fields(fields)
+            if key:
+                cache[key] = fields
+
+    return results
+
+
 def strip_version_constraint(dep: str) -> str:
     """Strip version constraints from dependency string."""
     # Handle formats like "package>=1.0", "package>1.0", "package=1.0"
-    return re.split(r'[><=]', dep)[0].strip()
-
-
-def normalize_dep_name(dep: str) -> str:
-    """Normalize a dependency name by removing .so suffix and other variations."""
-    dep = strip_version_constraint(dep)
+    match = _VERSION_CONSTRAINT_RE.search(dep)
+    if match is None:
+        return dep.strip()
+    return dep[:match.start()].strip()
+
+
+@cache
+def _dep_lookup() -> Mapping[str, Optional[str]]:
+    """
+    Read-only lookup built on first use. Bare soname dependencies are keyed
+    with their ".so" suffix; explicit package mappings take precedence over
+    soname mappings for them, and over Arch split/config package mappings.
+    """
+    arch_map = arch_to_rookery()
+    lookup = {
+        **arch_split_packages(),
+        **arch_map,
+        **{f"{name}.so": pkg for name, pkg in {**lib_mappings(), **arch_map}.items()},
+    }
+    # Intern the Rookery names so mapped dependencies share one string object
+    return MappingProxyType({name: pkg and sys.intern(pkg) for name, pkg in lookup.items()})
 
-    # Remove .so suffix (e.g., "libncursesw.so" -> "libncursesw")
-    if dep.endswith(".so"):
-        dep = dep[:-3]
 
-    # Remove lib prefix variations for matching (but keep for final result)
-    # This helps map things like "libfoo" to existing package "foo"
-    return dep
+@cache
+def split_dep(dep: str) -> tuple[str, bool]:
+    """
+    Split a dependency string into (name, is_soname).
+    The name has its version constraint and .so suffix removed
+    (e.g. "libncursesw.so" -> "libncursesw"); is_soname is True for bare
+    library dependencies such as "libncursesw.so".
+    """
+    match = _DEP_RE.fullmatch(dep)
+    return sys.intern(match.group(1)), match.end(2) == len(dep)
 
 
+@cache
 def map_arch_to_rookery(arch_dep: str) -> Optional[str]:
     """Map an Arch package name to Rookery package name."""
-    dep = normalize_dep_name(arch_dep)
+    dep, is_soname = split_dep(arch_dep)
 
     # Check if it's in the ignore list
-    if dep in IGNORE_PACKAGES:
+    if dep in ignore_packages():
         return None
 
+    return _map_dep_name(dep, is_soname)
+
+
+def map_arch_deps(arch_deps: list[str]) -> set[str]:
+    """Map a list of Arch dependencies to the set of Rookery package names."""
+    ignored = ignore_packages()
+    mapped = {_map_dep_name(dep, is_soname) for dep, is_soname in set(map(split_dep, arch_deps))
+              if dep not in ignored}
+    return set(filter(None, mapped))
+
+
+@cache
+def _map_dep_name(dep: str, is_soname: bool) -> Optional[str]:
+    """Map a split, non-ignored dependency name to a Rookery package name."""
     # Check explicit mapping first
-    if dep in ARCH_TO_ROOKERY:
-        result = ARCH_TO_ROOKERY[dep]
+    result = _dep_lookup().get(f"{dep}.so" if is_soname else dep, _UNMAPPED)
+    if result is not _UNMAPPED:
         return result  # May be None to explicitly ignore
 
     # Handle .so library names - these are typically provided by a package
     # with a similar name, so we should ignore them as they're not package names
-    if arch_dep.endswith(".so"):
-        # Try common lib mappings
-        lib_mappings = {
-            "libncursesw": "ncurses",
-            "libncurses": "ncurses",
-            "libreadline": "readline",
-            "libz": "zlib",
-            "libbz2": "bzip2",
-            "liblzma": "xz",
-            "libzstd": "zstd",
-            "liblz4": "lz4",
-            "libcrypto": "openssl",
-            "libssl": "openssl",
-            "libcurl": "curl",
-            "libxml2": "libxml2",
-            "libxslt": "libxslt",
-            "libpng16": "libpng",
-            "libpng": "libpng",
-            "libjpeg": "libjpeg-turbo",
-            "libtiff": "libtiff",
-            "libwebp": "libwebp",
-            "libgif": "giflib",
-            "libfreetype": "freetype",
-            "libfontconfig": "fontconfig",
-            "libharfbuzz": "harfbuzz",
-            "libpango-1.0": "pango",
-            "libcairo": "cairo",
-            "libpixman-1": "pixman",
-            "libfribidi": "fribidi",
-            "libglib-2.0": "glib2",
-            "libgio-2.0": "glib2",
-            "libgobject-2.0": "glib2",
-            "libgmodule-2.0": "glib2",
-            "libgthread-2.0": "glib2",
-            "libgtk-3": "gtk3",
-            "libgtk-4": "gtk4",
-            "libgdk-3": "gtk3",
-            "libgdk_pixbuf-2.0": "gdk-pixbuf2",
-            "libatk-1.0": "at-spi2-core",
-            "libatspi": "at-spi2-core",
-            "libdbus-1": "dbus",
-            "libsystemd": "systemd",
-            "libudev": "systemd",
-            "libpulse": "pulseaudio",
-            "libpulse-simple": "pulseaudio",
-            "libasound": "alsa-lib",
-            "libpipewire-0.3": "pipewire",
-            "libspa-0.2": "pipewire",
-            "libX11": "libx11",
-            "libXext": "libxext",
-            "libXrender": "libxrender",
-            "libXi": "libxi",
-            "libXtst": "libxtst",
-            "libXcursor": "libxcursor",
-            "libXfixes": "libxfixes",
-            "libXdamage": "libxdamage",
-            "libXrandr": "libxrandr",
-            "libXinerama": "libxinerama",
-            "libXxf86vm": "libxxf86vm",
-            "libXshmfence": "libxshmfence",
-            "libXcomposite": "libxcomposite",
-            "libxcb": "libxcb",
-            "libxkbcommon": "libxkbcommon",
-            "libwayland-client": "wayland",
-            "libwayland-server": "wayland",
-            "libwayland-cursor": "wayland",
-            "libwayland-egl": "wayland",
-            "libdrm": "libdrm",
-            "libGL": "mesa",
-            "libGLESv2": "mesa",
-            "libEGL": "mesa",
-            "libgbm": "mesa",
-            "libvulkan": "vulkan-loader",
-            "libepoxy": "libepoxy",
-            "libva": "libva",
-            "libvdpau": "libvdpau",
-            "libinput": "libinput",
-            "libevdev": "libevdev",
-            "libffi": "libffi",
-            "libevent": "libevent",
-            "libuv": "libuv",
-            "libpcre2-8": "pcre2",
-            "libpcre": "pcre",
-            "libicu": "icu",
-            "libicui18n": "icu",
-            "libicuuc": "icu",
-            "libicudata": "icu",
-            "libexpat": "expat",
-            "libjson-c": "json-c",
-            "libsqlite3": "sqlite",
-            "liblmdb": "lmdb",
-            "libgcrypt": "libgcrypt",
-            "libgpg-error": "libgpg-error",
-            "libsecret-1": "libsecret",
-            "libcap": "libcap",
-            "libelf": None,  # Debug lib, usually optional
-            "libdw": None,  # Debug lib, usually optional
-            "libunwind": "libunwind",
-            "libboost_system": "boost",
-            "libboost_filesystem": "boost",
-            "libboost_thread": "boost",
-            "libopus": "opus",
-            "libvorbis": "libvorbis",
-            "libvorbisenc": "libvorbis",
-            "libvorbisfile": "libvorbis",
-            "libFLAC": "flac",
-            "libmp3lame": "lame",
-            "libsamplerate": "libsamplerate",
-            "libspeexdsp": "speexdsp",
-            "libavcodec": "ffmpeg",
-            "libavformat": "ffmpeg",
-            "libavutil": "ffmpeg",
-            "libswscale": "ffmpeg",
-            "libswresample": "ffmpeg",
-            "libavfilter": "ffmpeg",
-            "libavdevice": "ffmpeg",
-            "libpostproc": "ffmpeg",
-            "libgstreamer-1.0": "gstreamer",
-            # Additional lib mappings from report analysis
-            "libcrypt": "libxcrypt",
-            "libxcrypt": "libxcrypt",
-            "libgio-2.0": "glib2",
-            "libgmodule-2.0": "glib2",
-            "libgthread-2.0": "glib2",
-            "libgobject-2.0": "glib2",
-            "libglib-2.0": "glib2",
-            "libdbus-1": "dbus",
-            "libsystemd": "systemd",
-            "libudev": "systemd",
-            "libblkid": "util-linux",
-            "libmount": "util-linux",
-            "libuuid": "util-linux",
-            "libattr": "attr",
-            "libacl": "acl",
-            "libbz2": "bzip2",
-            "liblzma": "xz",
-            "libzstd": "zstd",
-            "liblz4": "lz4",
-            "libbrotlidec": "brotli",
-            "libbrotlienc": "brotli",
-            "libbrotlicommon": "brotli",
-            "libasound": "alsa-lib",
-            "libreadline": "readline",
-            "libncurses": "ncurses",
-            "libncursesw": "ncurses",
-            "libform": "ncurses",
-            "libformw": "ncurses",
-            "libmenu": "ncurses",
-            "libmenuw": "ncurses",
-            "libpanel": "ncurses",
-            "libpanelw": "ncurses",
-            "libtic": "ncurses",
-            "libtinfo": "ncurses",
-            "libtinfow": "ncurses",
-            "libQt6Core": "qt6",
-            "libQt6Gui": "qt6",
-            "libQt6Widgets": "qt6",
-            "libQt6Network": "qt6",
-            "libQt6DBus": "qt6",
-            "libQt6Qml": "qt6",
-            "libQt6Quick": "qt6",
-            "libQt6Svg": "qt6",
-            "libQt6Xml": "qt6",
-            "libQt6Concurrent": "qt6",
-            "libQt6OpenGL": "qt6",
-            "libQt6PrintSupport": "qt6",
-            "libQt6Sql": "qt6",
-            "libQt6Test": "qt6",
-            "libQt6WaylandClient": "qt6",
-            "libKF6CoreAddons": "kf6-kcoreaddons",
-            "libKF6ConfigCore": "kf6-kconfig",
-            "libKF6I18n": "kf6-ki18n",
-            "libKF6Service": "kf6-kservice",
-            "libKF6KIOCore": "kf6-kio",
-            "libKF6WidgetsAddons": "kf6-kwidgetsaddons",
-            "libKF6WindowSystem": "kf6-kwindowsystem",
-            "libKF6DBusAddons": "kf6-kdbusaddons",
-            "libKF6Crash": "kf6-kcrash",
-            "libKF6GuiAddons": "kf6-kguiaddons",
-        }
-        if dep in lib_mappings:
-            return lib_mappings[dep]
+    if is_soname:
         # Unknown .so library - ignore it as it's likely provided by another package
         return None
 
-    # Handle python- prefixed packages
-    if dep.startswith("python-"):
-        # Most python packages are build-only or optional, ignore for now
-        return None
-
-    # Handle perl- prefixed packages
-    if dep.startswith("perl-"):
-        # Most perl packages are build-only or optional, ignore for now
-        return None
-
-    # Handle lib32- packages (32-bit compat, not relevant for Rookery)
-    if dep.startswith("lib32-"):
-        return None
-
-    # Handle -git, -svn, -bzr, -hg suffixed packages (development versions)
-    for suffix in ["-git", "-svn", "-bzr", "-hg"]:
-        if dep.endswith(suffix):
-            return None
-
-    # Handle -docs packages
-    if dep.endswith("-docs") or dep.endswith("-doc"):
+    # Skip packages that are irrelevant for Rookery:
+    # python-/perl- modules (mostly build-only or optional), lib32- compat
+    # packages, VCS development versions and documentation packages
+    if dep.startswith(_IGNORED_PREFIXES) or dep.endswith(_IGNORED_SUFFIXES):
         return None
 
     # Handle -devel packages (Arch naming for -dev headers)
     if dep.endswith("-devel"):
         # Strip -devel and try to map the base package
         base = dep[:-6]
-        if base in ARCH_TO_ROOKERY:
-            return ARCH_TO_ROOKERY[base]
-        return base
-
-    # Handle Arch-specific split/config packages
-    arch_split_packages = {
-        "alsa-topology-conf": "alsa-lib",
-        "alsa-ucm-conf": "alsa-lib",
-        "bash-completion": None,  # Optional
-        "nss-mdns": None,  # Optional
-        "debuginfod": None,  # Optional
-        "xorg-font-util": None,  # X.org build tool
-        "xorg-util-macros": None,  # X.org build macros
-        "xorg-xkbcomp": "xkeyboard-config",
-        "xtrans": None,  # X.org transport lib (build-only)
-        "gperf": None,  # Build tool
-        "gi-docgen": None,  # Doc generator
-        "itstool": None,  # Build tool
-        "xmltoman": None,  # Build tool
-        "graphviz": None,  # Build tool
-        "dbus-broker": "dbus",  # Alternative D-Bus impl
-        "mesa-libgl": "mesa",
-        "libstemmer": None,  # Stemming library
-        "libxmlb": None,  # XML library
-        "libfyaml": None,  # YAML library
-        "libatopology": "alsa-lib",
-        "libformw": "ncurses",
-        "libmenuw": "ncurses",
-        "libpanelw": "ncurses",
-        "psmisc": None,  # Optional utility
-        "po4a": None,  # Translation tool
-        "ed": None,  # Editor (build-only)
-        "uasm": None,  # Assembler (build-only)
-        "shadow": None,  # Shadow utils (implicit)
-        "libcrypt": "libxcrypt",
-    }
-    if dep in arch_split_packages:
-        return arch_split_packages[dep]
+        mapped = arch_to_rookery().get(base, base)
+        return mapped and sys.intern(mapped)
 
-    # Try direct mapping as last resort
+    # Try direct mapping as last resort (already interned by split_dep)
     return dep
 
 
 def compare_dependencies(rook_pkg: RookPackageInfo, arch_pkg: ArchPackageInfo) -> dict:
-    """Compare dependencies between rook and arch package."""
-    results = {
-        "missing_depends": [],
-        "missing_build_depends": [],
-        "missing_optional": [],
-        "extra_depends": [],
-        "extra_build_depends": [],
-    }
-
-    # Get Rookery dependency names (keys only)
-    rook_depends = set(rook_pkg.depends.keys())
-    rook_build_depends = set(rook_pkg.build_depends.keys())
-    rook_optional = set(rook_pkg.optional_depends.keys())
-
+    """
+    Compare dependencies between rook and arch package.
+    The missing_* entries are unordered sets; sort them for display.
+    """
     # Map Arch dependencies to Rookery names
-    arch_depends_mapped = set()
-    for dep in arch_pkg.depends:
-        mapped = map_arch_to_rookery(dep)
-        if mapped:
-            arch_depends_mapped.add(mapped)
-
-    arch_makedepends_mapped = set()
-    for dep in arch_pkg.makedepends:
-        mapped = map_arch_to_rookery(dep)
-        if mapped:
-            arch_makedepends_mapped.add(mapped)
-
-    arch_optdepends_mapped = set()
-    for dep in arch_pkg.optdepends:
-        mapped = map_arch_to_rookery(dep)
-        if mapped:
-            arch_optdepends_mapped.add(mapped)
-
-    # Find missing runtime dependencies
-    for dep in arch_depends_mapped:
-        if dep not in rook_depends and dep not in rook_build_depends:
-            results["missing_depends"].append(dep)
-
-    # Find missing build dependencies
-    for dep in arch_makedepends_mapped:
-        if dep not in rook_build_depends and dep not in rook_depends:
-            results["missing_build_depends"].append(dep)
-
-    # Find missing optional dependencies
-    for dep in arch_optdepends_mapped:
-        if dep not in rook_optional and dep not in rook_depends:
-            results["missing_optional"].append(dep)
-
-    return results
+    arch_depends_mapped = map_arch_deps(arch_pkg.depends)
+    arch_makedepends_mapped = map_arch_deps(arch_pkg.makedepends)
+    arch_optdepends_mapped = map_arch_deps(arch_pkg.optdepends)
+
+    # Rookery dependency tables are keyed by name, so each difference is a
+    # single set operation
+    return {
+        "missing_depends": arch_depends_mapped.difference(rook_pkg.depends, rook_pkg.build_depends),
+        "missing_build_depends": arch_makedepends_mapped.difference(rook_pkg.build_depends, rook_pkg.depends),
+        "missing_optional": arch_optdepends_mapped.difference(rook_pkg.optional_depends, rook_pkg.depends),
+        "extra_depends": set(),
+        "extra_build_depends": set(),
+    }
 
 
 def main():
@@ -1262,42 +697,53 @@ def main():
     parser.add_argument("--package", "-p", help="Check specific package only")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--fix", action="store_true", help="Show suggested fixes")
+    parser.add_argument("--jobs", "-j", type=int, default=FETCH_WORKERS,
+                        help=f"Concurrent connections to the Arch API (default: {FETCH_WORKERS})")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Revalidate all cached Arch API responses, ignoring their age")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the Arch API response and parsed-spec caches")
     args = parser.parse_args()
 
+    global _cache_refresh, _cache_disabled
+    _cache_refresh = args.refresh
+    _cache_disabled = args.no_cache
+
     specs_dir = Path(args.specs_dir)
     if not specs_dir.exists():
         print(f"Error: specs directory not found: {specs_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # Get list of .rook files to check
+    # Get list of .rook files to check from a single directory scan
+    spec_files = list_specs(specs_dir)
     if args.package:
-        rook_files = list(specs_dir.glob(f"{args.package}.rook"))
-        if not rook_files:
-            # Try with kf6- prefix
-            rook_files = list(specs_dir.glob(f"kf6-{args.package}.rook"))
-        if not rook_files:
+        # Try with kf6- prefix
+        rook_file = spec_files.get(args.package) or spec_files.get(f"kf6-{args.package}")
+        if not rook_file:
             print(f"Error: Package not found: {args.package}", file=sys.stderr)
             sys.exit(1)
+        rook_files = [rook_file]
     else:
-        rook_files = sorted(specs_dir.glob("*.rook"))
+        rook_files = sorted(spec_files.values())
 
-    total_missing = 0
-    packages_with_issues = 0
+    spec_cache = {} if args.no_cache else load_spec_cache()
+    parsed = parse_rook_files(rook_files, spec_cache)
+    rook_pkgs = [(rook_file, rook_pkg) for rook_file, rook_pkg in zip(rook_files, parsed) if rook_pkg]
+    if not args.no_cache:
+        save_spec_cache(spec_cache)
 
-    for rook_file in rook_files:
-        rook_pkg = parse_rook_file(rook_file)
-        if not rook_pkg:
-            continue
+    # Determine Arch package names (strip kf6- prefix for Arch lookup)
+    arch_names = [rook_pkg.name.removeprefix("kf6-") for _, rook_pkg in rook_pkgs]
+    arch_pkgs = fetch_arch_packages(arch_names, max_workers=args.jobs)
 
-        # Determine Arch package name
-        arch_name = rook_pkg.name
-        if arch_name.startswith("kf6-"):
-            arch_name = arch_name[4:]  # Strip kf6- prefix for Arch lookup
+    total_missing = 0
+    packages_with_issues = 0
 
+    for (rook_file, rook_pkg), arch_name in zip(rook_pkgs, arch_names):
         if args.verbose:
             print(f"Checking {rook_pkg.name}...", end=" ", flush=True)
 
-        arch_pkg = fetch_arch_package_info(arch_name)
+        arch_pkg = arch_pkgs[arch_name]
         if not arch_pkg:
             if args.verbose:
                 print("(not found in Arch)")
@@ -7,9 +7,14 @@ Reads the dependency report and updates each .rook file with missing dependencie
 import re
 import sys
 import tomllib
+from itertools import repeat
 from pathlib import Path
+from typing import Mapping, Optional
 from dataclasses import dataclass, field
 
+from _dep_maps import lib_mappings
+from _fileutil import capture_output, list_specs, map_files, write_atomic
+
 
 @dataclass
 class PackageIssues:
@@ -20,73 +25,131 @@ class PackageIssues:
     missing_optional: list[str] = field(default_factory=list)
 
 
+# Report scanning: one block per package, the "Missing ... dependencies:"
+# lists inside it, and the "- dep" entries of each list
+_PKG_RE = re.compile(r'^Package:[ \t]*(\S+)[ \t]*$(.*?)(?=^Package:|\Z)', re.M | re.S)
+_SECTION_RE = re.compile(r'Missing (runtime|build|optional) dependencies:\n((?:[ \t]*-[ \t]*\S+[ \t]*(?:\n|\Z))+)')
+_DEP_RE = re.compile(r'^[ \t]*-[ \t]*(\S+)', re.M)
+
+# Report section name -> PackageIssues attribute
+_SECTION_FIELDS = {
+    "runtime": "missing_depends",
+    "build": "missing_build_depends",
+    "optional": "missing_optional",
+}
+
+# Header patterns for the dependency tables fix_deps edits
+_SECTION_HEADER_RES = {
+    name: re.compile(rf'^\[{name}\]\s*$')
+    for name in ("depends", "build_depends", "optional_depends")
+}
+
+# Common minimum versions for well-known packages
+_KNOWN_VERSIONS = {
+    "glibc": "2.39",
+    "gcc": "10.0",
+    "systemd": "255",
+    "glib2": "2.78",
+    "gtk3": "3.24",
+    "gtk4": "4.12",
+    "qt6": "6.6",
+    "python": "3.12",
+    "perl": "5.38",
+    "ncurses": "6.4",
+    "readline": "8.2",
+    "openssl": "3.0",
+    "curl": "8.0",
+    "libxml2": "2.12",
+    "libxslt": "1.1",
+    "zlib": "1.3",
+    "bzip2": "1.0",
+    "xz": "5.4",
+    "zstd": "1.5",
+    "dbus": "1.14",
+    "polkit": "124",
+    "wayland": "1.22",
+    "mesa": "24.0",
+    "libdrm": "2.4",
+    "freetype": "2.13",
+    "fontconfig": "2.14",
+    "harfbuzz": "8.0",
+    "cairo": "1.18",
+    "pango": "1.52",
+    "libpng": "1.6",
+    "libjpeg-turbo": "3.0",
+    "sqlite": "3.45",
+    "libffi": "3.4",
+    "expat": "2.6",
+    "pcre2": "10.42",
+    "icu": "74",
+    "libx11": "1.8",
+    "libxcb": "1.16",
+    "libxi": "1.8",
+    "libxext": "1.3",
+    "libxfixes": "6.0",
+    "libxrandr": "1.5",
+    "libxtst": "1.2",
+    "libxkbcommon": "1.6",
+    "alsa-lib": "1.2",
+    "pulseaudio": "17.0",
+    "pipewire": "1.0",
+    "ffmpeg": "7.0",
+    "gstreamer": "1.24",
+    "libcap": "2.69",
+    "libsecret": "0.21",
+    "libgcrypt": "1.10",
+    "libgpg-error": "1.48",
+    "json-c": "0.17",
+    "libevent": "2.1",
+    "libusb": "1.0",
+    "libarchive": "3.7",
+    "attr": "2.5",
+    "acl": "2.3",
+    "libinput": "1.25",
+    "libevdev": "1.13",
+    "bluez": "5.72",
+    "cups": "2.4",
+    "samba": "4.20",
+    "gettext": "0.22",
+    "vala": "0.56",
+    "libsamplerate": "0.2",
+    "fftw": "3.3",
+    "pciutils": "3.10",
+    "librsvg": "2.58",
+    "gdk-pixbuf2": "2.42",
+    "gsettings-desktop-schemas": "46.0",
+}
+
+
 def parse_report(report_path: Path) -> list[PackageIssues]:
     """Parse the dependency report file."""
+    text = report_path.read_text()
     packages = []
-    current_pkg = None
-    current_section = None
-
-    with open(report_path, "r") as f:
-        for line in f:
-            line = line.rstrip()
-
-            # New package section
-            if line.startswith("Package: "):
-                if current_pkg:
-                    packages.append(current_pkg)
-                pkg_name = line[9:].strip()
-                current_pkg = PackageIssues(name=pkg_name)
-                current_section = None
-
-            # Section headers
-            elif "Missing runtime dependencies:" in line:
-                current_section = "depends"
-            elif "Missing build dependencies:" in line:
-                current_section = "build_depends"
-            elif "Missing optional dependencies:" in line:
-                current_section = "optional"
-
-            # Dependency entries
-            elif line.strip().startswith("- ") and current_pkg and current_section:
-                dep = line.strip()[2:].strip()
-                if current_section == "depends":
-                    current_pkg.missing_depends.append(dep)
-                elif current_section == "build_depends":
-                    current_pkg.missing_build_depends.append(dep)
-                elif current_section == "optional":
-                    current_pkg.missing_optional.append(dep)
-
-            # Section separator
-            elif line.startswith("===="):
-                current_section = None
-
-    # Don't forget last package
-    if current_pkg:
-        packages.append(current_pkg)
-
-    return packages
 
+    for pkg_match in _PKG_RE.finditer(text):
+        pkg = PackageIssues(name=pkg_match.group(1))
+        for section in _SECTION_RE.finditer(pkg_match.group(2)):
+            getattr(pkg, _SECTION_FIELDS[section.group(1)]).extend(
+                _DEP_RE.findall(section.group(2)))
+        packages.append(pkg)
 
-def read_rook_file(path: Path) -> str:
-    """Read a .rook file and return its contents."""
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    return packages
 
 
-def find_section_end(content: str, section_name: str) -> tuple[int, int, str]:
+def find_section_end_lines(lines: list[str], section_name: str) -> tuple[int, int]:
     """
-    Find the end position of a TOML section and return (start, end, existing_content).
-    Returns positions where we can insert new entries.
+    Find a TOML section in the split file and return (start, end) line indices.
+    start is the header line and end is one past the last line of the section,
+    or (-1, -1) if the section is missing.
     """
     # Pattern to match section header
-    section_pattern = rf'^\[{re.escape(section_name)}\]\s*$'
+    section_re = _SECTION_HEADER_RES[section_name]
 
-    lines = content.split('\n')
     section_start = -1
     section_end = -1
 
     for i, line in enumerate(lines):
-        if re.match(section_pattern, line.strip()):
+        if section_re.match(line.strip()):
             section_start = i
         elif section_start >= 0 and line.strip().startswith('[') and not line.strip().startswith('[['):
             # Found next section
@@ -97,262 +160,144 @@ def find_section_end(content: str, section_name: str) -> tuple[int, int, str]:
         # Section goes to end of file
         section_end = len(lines)
 
-    if section_start >= 0:
-        # Get existing content in section (skip header)
-        section_content = '\n'.join(lines[section_start+1:section_end])
-        return section_start, section_end, section_content.strip()
-
-    return -1, -1, ""
+    return section_start, section_end
 
 
-def get_existing_deps(content: str, section_name: str) -> set[str]:
-    """Get existing dependencies from a section."""
-    _, _, section_content = find_section_end(content, section_name)
-
-    existing = set()
-    for line in section_content.split('\n'):
-        line = line.strip()
-        if line and not line.startswith('#') and '=' in line:
-            # Extract package name (before the =)
-            pkg_name = line.split('=')[0].strip().strip('"')
-            existing.add(pkg_name)
-
-    return existing
-
-
-def add_deps_to_section(content: str, section_name: str, deps: list[str]) -> str:
-    """Add dependencies to a section in the .rook file."""
+def add_deps_to_lines(lines: list[str], section_name: str, deps: list[str],
+                      existing: set[str]) -> bool:
+    """
+    Add dependencies to a section of the split .rook file in place, skipping
+    names in `existing`. Returns True if any lines were inserted.
+    """
     if not deps:
-        return content
-
-    existing = get_existing_deps(content, section_name)
+        return False
 
     # Filter out deps that already exist
     new_deps = [d for d in deps if d not in existing]
     if not new_deps:
-        return content
+        return False
 
-    lines = content.split('\n')
-    section_start, section_end, section_content = find_section_end(content, section_name)
+    section_start, section_end = find_section_end_lines(lines, section_name)
 
     if section_start < 0:
         # Section doesn't exist - this shouldn't happen for standard .rook files
         print(f"    Warning: Section [{section_name}] not found")
-        return content
-
-    # Common minimum versions for well-known packages
-    known_versions = {
-        "glibc": "2.39",
-        "gcc": "10.0",
-        "systemd": "255",
-        "glib2": "2.78",
-        "gtk3": "3.24",
-        "gtk4": "4.12",
-        "qt6": "6.6",
-        "python": "3.12",
-        "perl": "5.38",
-        "ncurses": "6.4",
-        "readline": "8.2",
-        "openssl": "3.0",
-        "curl": "8.0",
-        "libxml2": "2.12",
-        "libxslt": "1.1",
-        "zlib": "1.3",
-        "bzip2": "1.0",
-        "xz": "5.4",
-        "zstd": "1.5",
-        "dbus": "1.14",
-        "polkit": "124",
-        "wayland": "1.22",
-        "mesa": "24.0",
-        "libdrm": "2.4",
-        "freetype": "2.13",
-        "fontconfig": "2.14",
-        "harfbuzz": "8.0",
-        "cairo": "1.18",
-        "pango": "1.52",
-        "libpng": "1.6",
-        "libjpeg-turbo": "3.0",
-        "sqlite": "3.45",
-        "libffi": "3.4",
-        "expat": "2.6",
-        "pcre2": "10.42",
-        "icu": "74",
-        "libx11": "1.8",
-        "libxcb": "1.16",
-        "libxi": "1.8",
-        "libxext": "1.3",
-        "libxfixes": "6.0",
-        "libxrandr": "1.5",
-        "libxtst": "1.2",
-        "libxkbcommon": "1.6",
-        "alsa-lib": "1.2",
-        "pulseaudio": "17.0",
-        "pipewire": "1.0",
-        "ffmpeg": "7.0",
-        "gstreamer": "1.24",
-        "libcap": "2.69",
-        "libsecret": "0.21",
-        "libgcrypt": "1.10",
-        "libgpg-error": "1.48",
-        "json-c": "0.17",
-        "libevent": "2.1",
-        "libusb": "1.0",
-        "libarchive": "3.7",
-        "attr": "2.5",
-        "acl": "2.3",
-        "libinput": "1.25",
-        "libevdev": "1.13",
-        "bluez": "5.72",
-        "cups": "2.4",
-        "samba": "4.20",
-        "gettext": "0.22",
-        "vala": "0.56",
-        "libsamplerate": "0.2",
-        "fftw": "3.3",
-        "pciutils": "3.10",
-        "librsvg": "2.58",
-        "gdk-pixbuf2": "2.42",
-        "gsettings-desktop-schemas": "46.0",
-    }
+        return False
 
     # Build new dependency lines
-    new_lines = []
-    for dep in sorted(new_deps):
-        version = known_versions.get(dep, "1.0")
-        new_lines.append(f'{dep} = ">= {version}"')
+    new_lines = [f'{dep} = ">= {_KNOWN_VERSIONS.get(dep, "1.0")}"' for dep in sorted(new_deps)]
 
     # Find insertion point (after existing deps, before empty lines at end of section)
     insert_at = section_start + 1
 
-    # Skip past existing content
-    for i in range(section_start + 1, section_end):
+    # Skip past existing content: scan back from the section end to the
+    # last entry
+    for i in range(section_end - 1, section_start, -1):
         line = lines[i].strip()
         if line and not line.startswith('#'):
             insert_at = i + 1
+            break
 
     # Insert new dependencies
-    for new_line in new_lines:
-        lines.insert(insert_at, new_line)
-        insert_at += 1
+    lines[insert_at:insert_at] = new_lines
+    return True
+
 
-    return '\n'.join(lines)
+def find_rook_file(spec_files: dict[str, Path], pkg_name: str) -> Optional[Path]:
+    """Find the .rook file for a package, trying with the kf6- prefix stripped."""
+    return spec_files.get(pkg_name) or spec_files.get(pkg_name.removeprefix("kf6-"))
 
 
-def fix_rook_file(specs_dir: Path, pkg: PackageIssues, dry_run: bool = False) -> bool:
-    """Fix a single .rook file with missing dependencies."""
-    # Find the .rook file
-    rook_path = specs_dir / f"{pkg.name}.rook"
+def _filter_deps(deps: list[str], pkg_name: str, existing: set[str],
+                 lib_to_pkg: Mapping[str, Optional[str]]) -> list[str]:
+    """Filter out self-deps and deps that map to existing packages."""
+    filtered = []
+    for d in deps:
+        # Skip self-references
+        if d == pkg_name:
+            continue
+        # Skip if it's a lib name that maps to an existing package
+        if d in lib_to_pkg and lib_to_pkg[d] in existing:
+            continue
+        # Skip if it directly exists
+        if d in existing:
+            continue
+        filtered.append(d)
+    return filtered
 
-    if not rook_path.exists():
-        # Try with kf6- prefix stripped
-        if pkg.name.startswith("kf6-"):
-            alt_name = pkg.name[4:]
-            rook_path = specs_dir / f"{alt_name}.rook"
 
-    if not rook_path.exists():
+def fix_rook_file(rook_path: Optional[Path], pkg: PackageIssues) -> tuple[Optional[Path], Optional[str]]:
+    """
+    Work out the fixes for a single .rook file without writing it.
+    Returns (path, new_content); new_content is None if nothing needs to change.
+    """
+    if rook_path is None:
         print(f"  Skipping {pkg.name}: .rook file not found")
-        return False
+        return None, None
 
     print(f"  Fixing {rook_path.name}...")
 
-    content = read_rook_file(rook_path)
-    original_content = content
-
-    # Map common lib names to their package names for filtering
-    lib_to_pkg = {
-        "libasound": "alsa-lib",
-        "libncursesw": "ncurses",
-        "libncurses": "ncurses",
-        "libreadline": "readline",
-        "libsystemd": "systemd",
-        "libudev": "systemd",
-        "libxml2": "libxml2",
-        "libxslt": "libxslt",
-        "libglib-2.0": "glib2",
-        "libgio-2.0": "glib2",
-        "libgobject-2.0": "glib2",
-        "libpng": "libpng",
-        "libpng16": "libpng",
-        "libjpeg": "libjpeg-turbo",
-        "libfreetype": "freetype",
-        "libfontconfig": "fontconfig",
-        "libharfbuzz": "harfbuzz",
-        "libcairo": "cairo",
-        "libpango-1.0": "pango",
-        "libgtk-3": "gtk3",
-        "libgtk-4": "gtk4",
-        "libdbus-1": "dbus",
-        "libcurl": "curl",
-        "libssl": "openssl",
-        "libcrypto": "openssl",
-        "libz": "zlib",
-        "libbz2": "bzip2",
-        "liblzma": "xz",
-        "libzstd": "zstd",
-        "libffi": "libffi",
-        "libexpat": "expat",
-        "libpcre2-8": "pcre2",
-        "libsqlite3": "sqlite",
-        "libX11": "libx11",
-        "libxcb": "libxcb",
-        "libwayland-client": "wayland",
-        "libpulse": "pulseaudio",
-        "libpipewire-0.3": "pipewire",
-    }
+    content = rook_path.read_text(encoding="utf-8")
 
     # Get existing deps to avoid duplicates with different names
-    existing_depends = get_existing_deps(content, "depends")
-    existing_build = get_existing_deps(content, "build_depends")
-    existing_optional = get_existing_deps(content, "optional_depends")
-    all_existing = existing_depends | existing_build | existing_optional
-
-    def filter_deps(deps: list[str], pkg_name: str) -> list[str]:
-        """Filter out self-deps and deps that map to existing packages."""
-        filtered = []
-        for d in deps:
-            # Skip self-references
-            if d == pkg_name:
-                continue
-            # Skip if it's a lib name that maps to an existing package
-            if d in lib_to_pkg and lib_to_pkg[d] in all_existing:
-                continue
-            # Skip if it directly exists
-            if d in all_existing:
-                continue
-            filtered.append(d)
-        return filtered
-
-    pkg.missing_depends = filter_deps(pkg.missing_depends, pkg.name)
-    pkg.missing_build_depends = filter_deps(pkg.missing_build_depends, pkg.name)
-    pkg.missing_optional = filter_deps(pkg.missing_optional, pkg.name)
+    try:
+        parsed = tomllib.loads(content)
+    except tomllib.TOMLDecodeError as e:
+        print(f"    Warning: Could not parse {rook_path.name}: {e}")
+        return rook_path, None
+
+    existing_depends = set(parsed.get("depends", {}))
+    existing_build = set(parsed.get("build_depends", {}))
+    existing_optional = set(parsed.get("optional_depends", {}))
+
+    if pkg.missing_depends or pkg.missing_build_depends or pkg.missing_optional:
+        all_existing = existing_depends | existing_build | existing_optional
+        # Map lib names to their package names for filtering (shared with check_deps.py)
+        lib_to_pkg = lib_mappings()
+        pkg.missing_depends = _filter_deps(pkg.missing_depends, pkg.name, all_existing, lib_to_pkg)
+        pkg.missing_build_depends = _filter_deps(pkg.missing_build_depends, pkg.name, all_existing, lib_to_pkg)
+        pkg.missing_optional = _filter_deps(pkg.missing_optional, pkg.name, all_existing, lib_to_pkg)
+
+    # Nothing left to add: skip splitting and scanning the file
+    if not (pkg.missing_depends or pkg.missing_build_depends or pkg.missing_optional):
+        print(f"    No changes needed")
+        return rook_path, None
+
+    lines = content.split('\n')
+    changed = False
 
     # Add missing runtime dependencies
     if pkg.missing_depends:
         print(f"    Adding {len(pkg.missing_depends)} runtime deps: {', '.join(pkg.missing_depends[:5])}{'...' if len(pkg.missing_depends) > 5 else ''}")
-        content = add_deps_to_section(content, "depends", pkg.missing_depends)
+        changed |= add_deps_to_lines(lines, "depends", pkg.missing_depends, existing_depends)
 
     # Add missing build dependencies
     if pkg.missing_build_depends:
         print(f"    Adding {len(pkg.missing_build_depends)} build deps: {', '.join(pkg.missing_build_depends[:5])}{'...' if len(pkg.missing_build_depends) > 5 else ''}")
-        content = add_deps_to_section(content, "build_depends", pkg.missing_build_depends)
+        changed |= add_deps_to_lines(lines, "build_depends", pkg.missing_build_depends, existing_build)
 
     # Add missing optional dependencies
     if pkg.missing_optional:
         print(f"    Adding {len(pkg.missing_optional)} optional deps: {', '.join(pkg.missing_optional[:5])}{'...' if len(pkg.missing_optional) > 5 else ''}")
-        content = add_deps_to_section(content, "optional_depends", pkg.missing_optional)
+        changed |= add_deps_to_lines(lines, "optional_depends", pkg.missing_optional, existing_optional)
 
-    if content == original_content:
+    if not changed:
         print(f"    No changes needed")
+        return rook_path, None
+
+    return rook_path, '\n'.join(lines)
+
+
+def write_rook_file(rook_path: Optional[Path], content: Optional[str], dry_run: bool = False) -> bool:
+    """Write the fixed content of a .rook file; returns True if the file was (or would be) updated."""
+    if content is None:
         return False
 
     if dry_run:
         print(f"    [DRY RUN] Would update {rook_path.name}")
         return True
 
-    # Write updated content
-    with open(rook_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    write_atomic(rook_path, content)
 
     print(f"    Updated {rook_path.name}")
     return True
@@ -413,9 +358,25 @@ def main():
         for pkg in packages:
             pkg.missing_build_depends = []
 
+    # Scan the specs directory once instead of probing for each package
+    spec_files = list_specs(specs_dir)
+    rook_paths = [find_rook_file(spec_files, pkg.name) for pkg in packages]
+
+    # Work out the fixes (in parallel for large reports); output and writes
+    # stay in report order. Entries for the same file must build on each
+    # other's changes, so a report naming a file twice is handled one entry
+    # at a time.
+    found = [rook_path for rook_path in rook_paths if rook_path]
+    fixes = repeat(fix_rook_file)
+    if len(set(found)) < len(found):
+        results = map(capture_output, fixes, rook_paths, packages)
+    else:
+        results = map_files(capture_output, fixes, rook_paths, packages)
+
     fixed_count = 0
-    for pkg in packages:
-        if fix_rook_file(specs_dir, pkg, dry_run=args.dry_run):
+    for (rook_path, content), output in results:
+        sys.stdout.write(output)
+        if write_rook_file(rook_path, content, dry_run=args.dry_run):
             fixed_count += 1
 
     print(f"\n{'='*60}")
@@ -0,0 +1,131 @@
+"""
+Tests for the fast .rook table parser in check_deps.py.
+Run with: python -m unittest discover -s scripts
+"""
+
+import tomllib
+import unittest
+from pathlib import Path
+
+from check_deps import _ROOK_TABLES, _parse_rook_tables
+
+
+SPECS_DIR = Path(__file__).resolve().parent.parent / "specs"
+
+_SPEC = '''\
+[package]
+name = "demo"
+version = "1.0"
+release = 1
+
+[build]
+{build}
+
+[depends]
+glibc = ">= 2.40"
+'''
+
+
+class ParseRookTablesTest(unittest.TestCase):
+    def assert_matches_tomllib(self, text: str) -> None:
+        """The fast parser must agree with tomllib, or defer to it with None."""
+        tables = _parse_rook_tables(text)
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            self.assertIsNone(tables)
+            return
+        if tables is None:
+            return
+
+        for name in _ROOK_TABLES[1:]:
+            self.assertEqual(tables[name], data.get(name, {}), name)
+        for field in ("name", "version"):
+            self.assertEqual(tables["package"].get(field), data.get("package", {}).get(field), field)
+
+    def test_specs(self):
+        for path in sorted(SPECS_DIR.glob("*.rook")):
+            with self.subTest(spec=path.name):
+                self.assert_matches_tomllib(path.read_text(encoding="utf-8"))
+
+    def test_delimiters_outside_values(self):
+        for build in (
+            'steps = ["sed -e s/\'\'\'//"]',
+            'x = 1 # """ note',
+            "x = 1 # ''' note",
+            'x = "a \'\'\' b"',
+            'x = \'a """ b\'',
+            '# """',
+            'prep = """\nrm -f x # \'\'\'\n"""',
+            'prep = """ one line """',
+            'prep = \'\'\'\n[Desktop Entry]\n\'\'\'',
+            'prep = """\nquoted ""\n"""',
+            'prep = """\\\n  joined\n"""',
+            'files = [\n  "a", # trailing \'\'\'\n  "b",\n]',
+            'src = { url = "https://x/[y]", sha256 = "" }',
+        ):
+            with self.subTest(build=build):
+                text = _SPEC.format(build=build)
+                self.assertEqual(_parse_rook_tables(text)["depends"], {"glibc": ">= 2.40"})
+                self.assert_matches_tomllib(text)
+
+    def test_invalid_toml(self):
+        for build in (
+            'x = 1\nx = 2',
+            'x = "a"\n"x" = "b"',
+            'prep = """\nunterminated',
+            'steps = ["a" "b"]',
+            'src = { url = "a", url = "b" }',
+            'src = {\n url = "a" }',
+            'x = bare',
+            'x = 01',
+            'x = "\\q"',
+            '[depends]',
+            '[[depends]]',
+        ):
+            with self.subTest(build=build):
+                text = _SPEC.format(build=build)
+                self.assertIsNone(_parse_rook_tables(text))
+                self.assert_matches_tomllib(text)
+
+    def test_duplicate_dependency(self):
+        text = _SPEC.format(build="") + 'glibc = ">= 2.41"\n'
+        self.assertIsNone(_parse_rook_tables(text))
+        self.assert_matches_tomllib(text)
+
+    def test_unsupported_values_defer(self):
+        for text in (
+            _SPEC.format(build="") + 'zlib = { version = "1" }\n',
+            _SPEC.format(build="") + 'db5.3 = ">= 5.3"\n',
+            _SPEC.format(build="") + 'gtk = "\\u0033"\n',
+            _SPEC.replace('name = "demo"', 'name = """demo"""').format(build=""),
+            'depends = { glibc = ">= 2" }\n[package]\nname = "x"\n',
+            'package = { name = "y", version = "2" }\n[depends]\nglibc = ">= 2"\n',
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(_parse_rook_tables(text))
+                self.assert_matches_tomllib(text)
+
+    def test_control_characters(self):
+        for build in (
+            'x = "a\x00b"',
+            "x = 'a\x7fb'",
+            'x = 1 # a\x00b',
+            '# a\x7fb',
+            'prep = """\na\x00b\n"""',
+            'x = 1\ry = 2',
+        ):
+            with self.subTest(build=build):
+                text = _SPEC.format(build=build)
+                self.assertIsNone(_parse_rook_tables(text))
+                self.assert_matches_tomllib(text)
+
+    def test_literal_strings_and_crlf(self):
+        text = _SPEC.format(build="x = 'a'").replace('glibc = ">= 2.40"', "glibc = '>= 2.40'")
+        self.assert_matches_tomllib(text)
+        self.assert_matches_tomllib(text.replace("\n", "\r\n"))
+        self.assertEqual(_parse_rook_tables(text.replace("\n", "\r\n"))["depends"], {"glibc": ">= 2.40"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,13 +6,17 @@ Also updates source URLs to reflect the new version.
 
 import re
 import sys
+from functools import cache
 from pathlib import Path
+from typing import Optional
+
+from _fileutil import map_files, write_atomic
 
 OLD_VERSION = "6.2.4"
 NEW_VERSION = "6.4.4"
 
 # KDE Plasma packages that should be updated to 6.4.4
-PLASMA_PACKAGES = {
+PLASMA_PACKAGES = frozenset({
     "bluedevil",
     "breeze",
     "breeze-gtk",
@@ -67,44 +71,69 @@ PLASMA_PACKAGES = {
     "systemsettings",
     "wacomtablet",
     "xdg-desktop-portal-kde",
-}
+})
+
+
+@cache
+def _old_version_re(pkg_name: str) -> re.Pattern:
+    """
+    Match every place OLD_VERSION appears that may need updating: version
+    lines directly under a [[changelog]] header, other version lines, and
+    "<pkg_name>-<version>" in source URLs. The named group holds the prefix.
+    """
+    old = re.escape(OLD_VERSION)
+    return re.compile(
+        rf'(?:(?P<changelog>\[\[changelog\]\]\s*\n\s*version = ")|(?P<version>version = ")){old}(?=")'
+        rf'|(?P<source>{re.escape(pkg_name)}-){old}'
+    )
 
 
-def update_rook_file(path: Path, dry_run: bool = False) -> bool:
-    """Update version and source URLs in a .rook file."""
+def plan_rook_update(path: Path) -> Optional[str]:
+    """Return the updated contents of a .rook file, or None if it needs no update."""
     pkg_name = path.stem
     if pkg_name not in PLASMA_PACKAGES:
-        return False
+        return None
 
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = path.read_text(encoding="utf-8")
 
     original_content = content
 
     # Check if this package has the old version
     if f'version = "{OLD_VERSION}"' not in content:
-        return False
+        return None
 
-    # Update version in [package] section (first occurrence)
-    content = content.replace(f'version = "{OLD_VERSION}"', f'version = "{NEW_VERSION}"', 1)
+    # Update the version in a single pass: the first version line (the
+    # [package] section), every source URL, and version lines directly
+    # under a [[changelog]] header
+    first_version_done = False
 
-    # Update version in source URLs
-    content = content.replace(f"{pkg_name}-{OLD_VERSION}", f"{pkg_name}-{NEW_VERSION}")
+    def bump(match: re.Match) -> str:
+        nonlocal first_version_done
+        kind = match.lastgroup
+        if kind == "version" and first_version_done:
+            return match.group()
+        if kind != "source":
+            first_version_done = True
+        return match.group(kind) + NEW_VERSION
 
-    # Update version in [[changelog]] section
-    # Find the changelog section and update the version there too
-    changelog_pattern = rf'(\[\[changelog\]\]\s*\n\s*version = "){OLD_VERSION}(")'
-    content = re.sub(changelog_pattern, rf'\g<1>{NEW_VERSION}\2', content)
+    content = _old_version_re(pkg_name).sub(bump, content)
 
     if content == original_content:
+        return None
+
+    return content
+
+
+def update_rook_file(path: Path, content: Optional[str], dry_run: bool = False) -> bool:
+    """Write the updated contents of a .rook file."""
+    if content is None:
         return False
 
     if dry_run:
         print(f"  Would update {path.name}: {OLD_VERSION} -> {NEW_VERSION}")
         return True
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    write_atomic(path, content)
 
     return True
 
@@ -133,14 +162,19 @@ def main():
             print(f"Package '{args.package}' not found")
             sys.exit(1)
     else:
-        rook_files = sorted(specs_dir.glob("*.rook"))
+        # Only Plasma packages can need an update; skip scanning the rest
+        rook_files = sorted(path for name in PLASMA_PACKAGES
+                            if (path := specs_dir / f"{name}.rook").exists())
 
     print(f"Updating KDE Plasma packages from {OLD_VERSION} to {NEW_VERSION}")
     print(f"{'='*60}")
 
+    # Compute updates (in parallel for many files); writes and output stay in file order
     updated_count = 0
-    for rook_file in rook_files:
-        result = update_rook_file(rook_file, dry_run=args.dry_run)
+    updates = map_files(plan_rook_update, rook_files)
+
+    for rook_file, content in zip(rook_files, updates):
+        result = update_rook_file(rook_file, content, dry_run=args.dry_run)
         if result:
             updated_count += 1
             action = "[DRY RUN] Would update" if args.dry_run else "Updated"
@@ -5,14 +5,35 @@ Changes all source URLs to http://corvidae.social/RookerySource/<filename>
 Also resets sha256 hashes to "FIXME".
 """
 
+import json
+import os
 import re
 import sys
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
+from _fileutil import capture_output, list_specs, map_files, write_atomic
+
 
 MIRROR_BASE = "http://corvidae.social/RookerySource"
 
+# Per-specs-dir record of files already processed, as {filename: mtime_ns};
+# a file whose mtime has not changed since cannot need another update
+URL_CACHE_NAME = ".url_update_cache.json"
+# Bump whenever the rewrite rules change; the cache is only valid for the
+# MIRROR_BASE and rules version it was written with
+URL_RULES_VERSION = 1
+
+# Source entry URLs (groups 1-3) or sha256 values (groups 4-6), so both can
+# be rewritten in a single pass
+# Matches: source0 = { url = "https://...", sha256 = "..." }
+# Also handles multiline and various formats
+_SOURCE_RE = re.compile(r'(source\d+\s*=\s*\{\s*url\s*=\s*")([^"]+)(")|(sha256\s*=\s*")([^"]+)(")',
+                        re.ASCII)
+
 
+@lru_cache(maxsize=4096)
 def extract_filename_from_url(url: str) -> str:
     """Extract the filename from a URL."""
     # Remove any query parameters
@@ -23,17 +44,25 @@ def extract_filename_from_url(url: str) -> str:
 
 def update_rook_file(path: Path, dry_run: bool = False, reset_sha256: bool = True) -> bool:
     """Update source URLs in a .rook file to use the RookerySource mirror."""
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = path.read_text(encoding="utf-8")
+
+    # Nothing the regex could match: skip it entirely
+    if "source" not in content and "sha256" not in content:
+        return False
 
-    original_content = content
+    # Old values that get replaced, for the dry-run report
+    changed_urls = []
+    changed_hashes = []
 
-    # Pattern to match source entries with URLs
-    # Matches: source0 = { url = "https://...", sha256 = "..." }
-    # Also handles multiline and various formats
-    pattern = r'(source\d+\s*=\s*\{\s*url\s*=\s*")([^"]+)(")'
+    def replace(match):
+        # sha256 value: reset it to FIXME
+        if match.group(4) is not None:
+            old_hash = match.group(5)
+            if not reset_sha256 or old_hash == "FIXME":
+                return match.group(0)
+            changed_hashes.append(old_hash)
+            return f"{match.group(4)}FIXME{match.group(6)}"
 
-    def replace_url(match):
         prefix = match.group(1)
         old_url = match.group(2)
         suffix = match.group(3)
@@ -45,41 +74,63 @@ def update_rook_file(path: Path, dry_run: bool = False, reset_sha256: bool = Tru
         # Extract filename and create new URL
         filename = extract_filename_from_url(old_url)
         new_url = f"{MIRROR_BASE}/{filename}"
+        if new_url != old_url:
+            changed_urls.append(old_url)
 
         return f"{prefix}{new_url}{suffix}"
 
-    content = re.sub(pattern, replace_url, content)
+    # Rewrite URLs and reset sha256 hashes to FIXME
+    content = _SOURCE_RE.sub(replace, content)
 
-    # Reset sha256 hashes to FIXME
-    if reset_sha256:
-        # Pattern to match sha256 values (but not ones already set to FIXME)
-        sha256_pattern = r'(sha256\s*=\s*")[^"]+(")'
-        content = re.sub(sha256_pattern, r'\1FIXME\2', content)
-
-    if content == original_content:
+    if not changed_urls and not changed_hashes:
         return False
 
     if dry_run:
         # Show what would change
-        old_urls = re.findall(r'url\s*=\s*"([^"]+)"', original_content)
-        new_urls = re.findall(r'url\s*=\s*"([^"]+)"', content)
-        for old, new in zip(old_urls, new_urls):
-            if old != new:
-                print(f"    URL: {extract_filename_from_url(old)}")
-        # Check sha256 changes
-        old_hashes = re.findall(r'sha256\s*=\s*"([^"]+)"', original_content)
-        new_hashes = re.findall(r'sha256\s*=\s*"([^"]+)"', content)
-        for old_h, new_h in zip(old_hashes, new_hashes):
-            if old_h != new_h:
-                print(f"    sha256: {old_h[:20]}... -> FIXME")
+        for old_url in changed_urls:
+            print(f"    URL: {extract_filename_from_url(old_url)}")
+        for old_hash in changed_hashes:
+            print(f"    sha256: {old_hash[:20]}... -> FIXME")
         return True
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    write_atomic(path, content)
 
     return True
 
 
+def load_url_cache(cache_path: Path) -> dict[str, int]:
+    """
+    Load the processed-file mtimes saved by a previous run.
+    A cache written for another mirror or rules version is discarded.
+    """
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if (not isinstance(data, dict) or data.get("mirror") != MIRROR_BASE
+            or data.get("rules") != URL_RULES_VERSION or not isinstance(data.get("entries"), dict)):
+        return {}
+    return data["entries"]
+
+
+def save_url_cache(cache_path: Path, cache: dict[str, int]) -> None:
+    """
+    Persist the processed-file mtimes, replacing the file atomically.
+    Entries for files no longer in the specs directory are dropped.
+    """
+    present = {entry.name for entry in os.scandir(cache_path.parent)}
+    data = {
+        "mirror": MIRROR_BASE,
+        "rules": URL_RULES_VERSION,
+        "entries": {name: mtime for name, mtime in cache.items() if name in present},
+    }
+    try:
+        write_atomic(cache_path, json.dumps(data, sort_keys=True))
+    except OSError as e:
+        print(f"Warning: Could not save {cache_path}: {e}", file=sys.stderr)
+
+
 def main():
     import argparse
 
@@ -91,6 +142,8 @@ def main():
                         help="Show what would be changed without modifying files")
     parser.add_argument("--limit", "-l", type=int,
                         help="Limit number of packages to update")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Process every file, neither reading nor writing {URL_CACHE_NAME}")
     args = parser.parse_args()
 
     specs_dir = Path(args.specs_dir)
@@ -106,7 +159,7 @@ def main():
             print(f"Package '{args.package}' not found")
             sys.exit(1)
     else:
-        rook_files = sorted(specs_dir.glob("*.rook"))
+        rook_files = sorted(list_specs(specs_dir).values())
 
     if args.limit:
         rook_files = rook_files[:args.limit]
@@ -114,13 +167,32 @@ def main():
     print(f"Updating source URLs to use {MIRROR_BASE}/")
     print(f"{'='*60}")
 
+    # Skip files that are unchanged since a previous run processed them
+    cache_path = specs_dir / URL_CACHE_NAME
+    url_cache = {} if args.no_cache else load_url_cache(cache_path)
+    pending = [rook_file for rook_file in rook_files
+               if url_cache.get(rook_file.name) != rook_file.stat().st_mtime_ns]
+
+    # Update files (in parallel for many files); output stays in file order
     updated_count = 0
-    for rook_file in rook_files:
-        result = update_rook_file(rook_file, dry_run=args.dry_run)
+    results = map_files(capture_output, repeat(update_rook_file), pending, repeat(args.dry_run),
+                        chunksize=32)
+
+    # Collect the per-file report and write it in one go
+    out = []
+    for rook_file, (result, output) in zip(pending, results):
+        if not args.dry_run:
+            url_cache[rook_file.name] = rook_file.stat().st_mtime_ns
+        out.append(output)
         if result:
             updated_count += 1
             action = "[DRY RUN] Would update" if args.dry_run else "Updated"
-            print(f"  {action} {rook_file.name}")
+            out.append(f"  {action} {rook_file.name}\n")
+    sys.stdout.write("".join(out))
+
+    # A dry run must not touch the specs tree, and --no-cache leaves the cache alone
+    if not args.dry_run and not args.no_cache:
+        save_url_cache(cache_path, url_cache)
 
     print(f"\n{'='*60}")
     print(f"Summary:")